@@ -23,9 +23,47 @@ Version: 1.0
 
 from __future__ import annotations
 
+import functools
 import shutil
 import subprocess
-from typing import List, Optional, Tuple, Union
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Seconds that is_adb_available() and adb_version() results are reused
+_ADB_CACHE_TTL_S = 5.0
+
+
+def _ttl_cache(ttl: float) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+	"""
+	Memoize a function's result per positional-argument tuple for ``ttl`` seconds.
+	
+	Used for cheap-to-reuse lookups (PATH scans, ``adb version``) that the UI
+	repeats on every refresh or connect. The wrapped function gains a
+	``cache_clear()`` method to force the next call to run again.
+	
+	Args:
+		ttl (float): How long a result stays valid, in seconds
+		
+	Returns:
+		Callable: Decorator applying the cache
+	"""
+	def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+		cache: Dict[Tuple[Any, ...], Tuple[Any, float]] = {}
+
+		@functools.wraps(func)
+		def wrapper(*args: Any) -> Any:
+			now = time.monotonic()
+			hit = cache.get(args)
+			if hit is not None and hit[1] > now:
+				return hit[0]
+			value = func(*args)
+			cache[args] = (value, now + ttl)
+			return value
+
+		wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+		return wrapper
+	return decorator
 
 
 def _run(cmd: List[str], timeout: int = 15) -> Tuple[int, str, str]:
@@ -67,12 +105,15 @@ def _run(cmd: List[str], timeout: int = 15) -> Tuple[int, str, str]:
 		return 1, "", str(e)
 
 
+@_ttl_cache(_ADB_CACHE_TTL_S)
 def is_adb_available() -> bool:
 	"""
 	Check if ADB (Android Debug Bridge) is available on the system.
 	
 	This function checks if the ADB executable is available in the system PATH.
 	It's used to determine if ADB functionality should be enabled in the UI.
+	The result is cached for a few seconds; call ``is_adb_available.cache_clear()``
+	to re-check immediately.
 	
 	Returns:
 		bool: True if ADB is available, False otherwise
@@ -86,12 +127,14 @@ def is_adb_available() -> bool:
 	return shutil.which("adb") is not None
 
 
+@_ttl_cache(_ADB_CACHE_TTL_S)
 def adb_version() -> str:
 	"""
 	Get the version information of the installed ADB.
 	
 	This function executes 'adb version' and returns the version string.
 	It's useful for debugging and ensuring the correct ADB version is installed.
+	The result is cached for a few seconds, like is_adb_available().
 	
 	Returns:
 		str: ADB version string, or error message if ADB is not available
@@ -249,232 +292,6 @@ def send_commands(serial: Optional[str], commands: List[str], spacing_ms: int =
 	return 0, "\n".join(stdout_all).strip(), "\n".join(stderr_all).strip()
 
 
-# ===== Interactive Shell Management =====
-
-def start_interactive_shell(serial: Optional[str]) -> Tuple[bool, Union[subprocess.Popen, None], str]:
-	"""
-	Start an interactive ADB shell session.
-	
-	This function creates a persistent ADB shell process that can be used for
-	interactive communication with an Android device. The process runs in the
-	background and can receive commands and return output in real-time.
-	
-	Args:
-		serial (Optional[str]): Device serial number, or None for default device
-		
-	Returns:
-		Tuple[bool, Union[subprocess.Popen, None], str]: (success, process, message)
-			- success: True if shell started successfully
-			- process: Popen object for the shell process, or None if failed
-			- message: Success or error message
-			
-	Example:
-		>>> success, proc, msg = start_interactive_shell("emulator-5554")
-		>>> if success:
-		...     print(f"Shell started: {msg}")
-		...     # Use proc to send commands
-	"""
-	if not is_adb_available():
-		return False, None, "adb not found"
-	
-	try:
-		args = ["adb"]
-		if serial:
-			args.extend(["-s", serial])
-		args.append("shell")
-		
-		# Start the interactive shell process
-		process = subprocess.Popen(
-			args,
-			stdin=subprocess.PIPE,
-			stdout=subprocess.PIPE,
-			stderr=subprocess.PIPE,
-			text=True,
-			bufsize=0  # Unbuffered for real-time output
-		)
-		
-		# Wait a moment to ensure the process started
-		import time
-		time.sleep(0.1)
-		
-		if process.poll() is None:  # Process is still running
-			return True, process, f"Interactive shell started for device {serial or 'default'}"
-		else:
-			return False, None, "Failed to start interactive shell"
-			
-	except Exception as e:
-		return False, None, f"Error starting interactive shell: {str(e)}"
-
-
-def stop_interactive_shell(process: Optional[subprocess.Popen]) -> Tuple[bool, str]:
-	"""
-	Stop an interactive ADB shell session.
-	
-	This function properly terminates an interactive ADB shell process,
-	ensuring all resources are cleaned up.
-	
-	Args:
-		process (Optional[subprocess.Popen]): The shell process to terminate
-		
-	Returns:
-		Tuple[bool, str]: (success, message)
-			- success: True if shell stopped successfully
-			- message: Success or error message
-			
-	Example:
-		>>> success, msg = stop_interactive_shell(proc)
-		>>> print(f"Shell stopped: {msg}")
-	"""
-	if process is None:
-		return True, "No process to stop"
-	
-	try:
-		if process.poll() is None:  # Process is still running
-			# Send exit command to gracefully close the shell
-			try:
-				process.stdin.write("exit\n")
-				process.stdin.flush()
-			except Exception:
-				pass  # Ignore if stdin is already closed
-			
-			# Wait for process to terminate gracefully
-			try:
-				process.wait(timeout=2)
-			except subprocess.TimeoutExpired:
-				# Force terminate if it doesn't stop gracefully
-				process.terminate()
-				process.wait(timeout=1)
-		
-		return True, "Interactive shell stopped"
-		
-	except Exception as e:
-		return False, f"Error stopping interactive shell: {str(e)}"
-
-
-def send_shell_command(process: Optional[subprocess.Popen], command: str) -> Tuple[bool, str]:
-	"""
-	Send a command to an interactive ADB shell session.
-	
-	This function sends a command to a running interactive ADB shell process
-	and returns whether the command was sent successfully.
-	
-	Args:
-		process (Optional[subprocess.Popen]): The interactive shell process
-		command (str): Command to send
-		
-	Returns:
-		Tuple[bool, str]: (success, message)
-			- success: True if command was sent successfully
-			- message: Success or error message
-			
-	Example:
-		>>> success, msg = send_shell_command(proc, "ls /sdcard")
-		>>> if success:
-		...     print("Command sent successfully")
-	"""
-	if process is None:
-		return False, "No shell process available"
-	
-	if process.poll() is not None:
-		return False, "Shell process is not running"
-	
-	try:
-		# Send the command with newline
-		process.stdin.write(command + "\n")
-		process.stdin.flush()
-		return True, "Command sent successfully"
-		
-	except Exception as e:
-		return False, f"Error sending command: {str(e)}"
-
-
-def read_shell_output(process: Optional[subprocess.Popen]) -> Tuple[bool, str, str]:
-	"""
-	Read output from an interactive ADB shell session.
-	
-	This function reads available output from a running interactive ADB shell
-	process, checking both stdout and stderr.
-	
-	Args:
-		process (Optional[subprocess.Popen]): The interactive shell process
-		
-	Returns:
-		Tuple[bool, str, str]: (success, stdout, stderr)
-			- success: True if output was read successfully
-			- stdout: Standard output from the shell
-			- stderr: Standard error from the shell
-			
-	Example:
-		>>> success, stdout, stderr = read_shell_output(proc)
-		>>> if success:
-		...     print(f"Output: {stdout}")
-	"""
-	if process is None:
-		return False, "", "No shell process available"
-	
-	if process.poll() is not None:
-		return False, "", "Shell process is not running"
-	
-	try:
-		stdout = ""
-		stderr = ""
-		
-		# Read from stdout
-		try:
-			import select
-			if hasattr(select, 'select'):
-				# Unix-like systems
-				if select.select([process.stdout], [], [], 0)[0]:
-					stdout = process.stdout.read()
-			else:
-				# Windows - try to read what's available
-				stdout = process.stdout.read()
-		except Exception:
-			# Fallback for systems without select
-			try:
-				stdout = process.stdout.read()
-			except Exception:
-				pass
-		
-		# Read from stderr
-		try:
-			if hasattr(select, 'select'):
-				if select.select([process.stderr], [], [], 0)[0]:
-					stderr = process.stderr.read()
-			else:
-				stderr = process.stderr.read()
-		except Exception:
-			try:
-				stderr = process.stderr.read()
-			except Exception:
-				pass
-		
-		return True, stdout, stderr
-		
-	except Exception as e:
-		return False, "", f"Error reading output: {str(e)}"
-
-
-def is_shell_running(process: Optional[subprocess.Popen]) -> bool:
-	"""
-	Check if an interactive ADB shell session is still running.
-	
-	Args:
-		process (Optional[subprocess.Popen]): The shell process to check
-		
-	Returns:
-		bool: True if the shell process is still running
-		
-	Example:
-		>>> if is_shell_running(proc):
-		...     print("Shell is still active")
-	"""
-	if process is None:
-		return False
-	
-	return process.poll() is None
-
-
 # ===== Enhanced Device Management =====
 
 def get_device_info(serial: Optional[str]) -> Tuple[int, str, str]:
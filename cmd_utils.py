@@ -25,13 +25,44 @@ Version: 1.0
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
+import codecs
 import os
 import platform
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 
+# Lines kept in the terminal view; older lines are dropped by Qt
+_VIEW_MAX_BLOCKS = 5000
+
+# Process output is written to the view at most once per this interval
+_OUT_FLUSH_MS = 30
+
+# Control bytes dropped from shell output (includes the Ctrl+C echo, 0x03);
+# newline, carriage return and tab are kept
+_SHELL_CTRL_BYTES = bytes(b for b in range(32) if b not in (9, 10, 13))
+
+# Host details for the prompt headers; fixed for the life of the process
+_IS_WINDOWS = platform.system().lower().startswith('win')
+_PLATFORM_VERSION = platform.version()
+_HOST = platform.node()
+_USER = os.environ.get('USER') or os.environ.get('USERNAME') or ''
+
+_mono_font: Optional[QtGui.QFont] = None
+
+
+def mono_font() -> QtGui.QFont:
+	"""Return the shared monospace font used by the console and terminal views.
+
+	Built on first use, since a QFont needs the QGuiApplication to exist.
+	"""
+	global _mono_font
+	if _mono_font is None:
+		_mono_font = QtGui.QFont("Consolas", 10)
+	return _mono_font
+
+
 class TerminalWidget(QtWidgets.QWidget):
 	"""
 	Simple embedded CMD-like terminal using QProcess.
@@ -73,9 +104,12 @@ class TerminalWidget(QtWidgets.QWidget):
 		self.view = QtWidgets.QPlainTextEdit()
 		self.view.setReadOnly(True)
 		self.view.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
-		mono = QtGui.QFont("Consolas", 10)
-		self.view.setFont(mono)
+		self.view.setMaximumBlockCount(_VIEW_MAX_BLOCKS)
+		self.view.document().setUndoRedoEnabled(False)
+		self.view.setFont(mono_font())
 		v.addWidget(self.view, 1)
+		# Document cursor reused by _append_view for process output
+		self._view_cursor = QtGui.QTextCursor(self.view.document())
 		
 		# Create the input area
 		self.input = QtWidgets.QLineEdit()
@@ -108,7 +142,7 @@ class TerminalWidget(QtWidgets.QWidget):
 		
 		# Initialize process and platform detection
 		self.proc = None
-		self._is_windows = platform.system().lower().startswith('win')
+		self._is_windows = _IS_WINDOWS
 		
 		# Track current working directory for header/clear prompt convenience
 		try:
@@ -119,6 +153,21 @@ class TerminalWidget(QtWidgets.QWidget):
 		except Exception:
 			self.cwd = "C:\\" if self._is_windows else "/"
 		
+		# Output waiting to be written to the view: raw shell bytes (decoded once
+		# per flush) and already-decoded ADB shell text. A single-shot timer
+		# coalesces bursts so the view lays out once per flush interval.
+		self._out_buf = bytearray()
+		self._sub_pending: List[str] = []
+		# Decoders kept across reads so multi-byte UTF-8 characters split
+		# between chunks are not turned into replacement characters
+		self._out_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+		self._sub_out_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+		self._sub_err_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+		self._out_flush = QtCore.QTimer(self)
+		self._out_flush.setSingleShot(True)
+		self._out_flush.setInterval(_OUT_FLUSH_MS)
+		self._out_flush.timeout.connect(self._flush_out)
+		
 		# Start a persistent shell so it behaves like a normal terminal
 		self.proc = QtCore.QProcess(self)
 		self.proc.setProcessChannelMode(QtCore.QProcess.MergedChannels)
@@ -156,15 +205,12 @@ class TerminalWidget(QtWidgets.QWidget):
 		"""
 		try:
 			if self._is_windows:
-				ver = platform.version()
-				self.view.appendPlainText(f"Microsoft Windows [Version {ver}]")
+				self.view.appendPlainText(f"Microsoft Windows [Version {_PLATFORM_VERSION}]")
 				self.view.appendPlainText("(c) Microsoft Corporation. All rights reserved.")
 				self.view.appendPlainText("")
 				self.view.appendPlainText(self.cwd + ">")
 			else:
-				user = os.environ.get('USER') or os.environ.get('USERNAME') or ''
-				host = platform.node()
-				self.view.appendPlainText(f"{user}@{host}:{self.cwd}$")
+				self.view.appendPlainText(f"{_USER}@{_HOST}:{self.cwd}$")
 		except Exception:
 			pass
 
@@ -173,40 +219,58 @@ class TerminalWidget(QtWidgets.QWidget):
 		Handle output from the main shell process.
 		
 		This method is called whenever the main shell process (cmd.exe or bash)
-		produces output. It decodes the output and displays it in the terminal view.
+		produces output. The bytes are buffered and written to the terminal view
+		by _flush_out on the next flush tick.
 		"""
 		try:
 			data = self.proc.readAllStandardOutput().data()
 			if data:
-				try:
-					# First, filter out the Ctrl+C character (\x03) from raw bytes before decoding
-					# This prevents it from being decoded and displayed
-					filtered_data = bytes(b for b in data if b != 0x03)
-					if not filtered_data:
-						return  # If only Ctrl+C was in the data, skip it
-					
-					text = filtered_data.decode(errors='replace')
-					# Additional filtering: remove any control characters except newline, carriage return, tab
-					# This catches any that might have slipped through
-					filtered_text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\r\t')
-					text = filtered_text
-				except Exception:
-					# If decoding fails, filter bytes directly
-					filtered_data = bytes(b for b in data if b != 0x03 and (b >= 32 or b in (10, 13, 9)))
-					if not filtered_data:
-						return
-					text = filtered_data.decode(errors='ignore')
-					# Also filter control chars from string representation
-					text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\r\t')
-				
+				self._out_buf += data
+				if not self._out_flush.isActive():
+					self._out_flush.start()
+		except Exception:
+			pass
+
+	def _flush_out(self) -> None:
+		"""
+		Write all buffered process output to the terminal view in one insert.
+		"""
+		try:
+			text = ""
+			if self._out_buf:
+				data = bytes(self._out_buf)
+				self._out_buf.clear()
+				# Filter out Ctrl+C (\x03) and other control characters except
+				# newline, carriage return and tab before decoding; UTF-8 never
+				# decodes multi-byte sequences to these, so this matches filtering
+				# the text. errors='replace' cannot raise, so no fallback is needed.
+				text = self._out_decoder.decode(data.translate(None, _SHELL_CTRL_BYTES))
 				# Only display if there's actual content (not just control chars)
-				if text.strip() or text.endswith('\n') or text.endswith('\r\n'):
-					self.view.moveCursor(QtGui.QTextCursor.End)
-					self.view.insertPlainText(text)
-					self.view.moveCursor(QtGui.QTextCursor.End)
+				if not (text.strip() or text.endswith('\n') or text.endswith('\r\n')):
+					text = ""
+			if self._sub_pending:
+				text += "".join(self._sub_pending)
+				self._sub_pending.clear()
+			if text:
+				self._append_view(text)
 		except Exception:
 			pass
 
+	def _append_view(self, text: str) -> None:
+		"""Append raw text at the end of the view (no implicit newline).
+
+		Inserts through a cached document cursor instead of moving the view's
+		cursor before and after, and keeps the view pinned to the bottom only
+		if it was already there.
+		"""
+		bar = self.view.verticalScrollBar()
+		follow = bar.value() >= bar.maximum()
+		cursor = self._view_cursor
+		cursor.movePosition(QtGui.QTextCursor.End)
+		cursor.insertText(text)
+		if follow:
+			bar.setValue(bar.maximum())
+
 	def _on_sub_out(self) -> None:
 		"""
 		Handle output from ADB shell subprocess.
@@ -236,7 +300,7 @@ class TerminalWidget(QtWidgets.QWidget):
 				# Process stdout
 				if stdout_data:
 					try:
-						text = stdout_data.decode(errors='replace')
+						text = self._sub_out_decoder.decode(stdout_data)
 						total_text += text
 						print(f"[DEBUG] ADB stdout received: {repr(text)}")
 						
@@ -250,7 +314,7 @@ class TerminalWidget(QtWidgets.QWidget):
 				# Process stderr
 				if stderr_data:
 					try:
-						text = stderr_data.decode(errors='replace')
+						text = self._sub_err_decoder.decode(stderr_data)
 						total_text += text
 						print(f"[DEBUG] ADB stderr received: {repr(text)}")
 						
@@ -267,12 +331,11 @@ class TerminalWidget(QtWidgets.QWidget):
 				
 				read_count += 1
 			
-			# Display all collected text at once
+			# Queue all collected text for the next view flush
 			if total_text:
-				self.view.moveCursor(QtGui.QTextCursor.End)
-				self.view.insertPlainText(total_text)
-				self.view.moveCursor(QtGui.QTextCursor.End)
-				self.view.repaint()
+				self._sub_pending.append(total_text)
+				if not self._out_flush.isActive():
+					self._out_flush.start()
 					
 		except Exception as e:
 			print(f"[DEBUG] Error in _on_sub_out: {e}")
@@ -317,8 +380,7 @@ class TerminalWidget(QtWidgets.QWidget):
 		"""
 		try:
 			# Clear input field to prevent any pending text from being sent
-			if hasattr(self, 'input'):
-				self.input.clear()
+			self.input.clear()
 			
 			# If we're in an ADB shell subsession, send Ctrl+C to interrupt current command
 			# but DON'T terminate the ADB shell session - keep it alive like a normal terminal
@@ -328,7 +390,6 @@ class TerminalWidget(QtWidgets.QWidget):
 						# Send Ctrl+C to interrupt the current command (e.g., 'top')
 						# This should stop the command but keep the ADB shell session alive
 						self._subproc.write(b'\x03')  # Ctrl+C
-						self._subproc.waitForBytesWritten(100)
 						# Don't terminate the process - just interrupt the command
 						# The ADB shell should remain active and show the prompt again
 						return
@@ -341,7 +402,6 @@ class TerminalWidget(QtWidgets.QWidget):
 					# Send Ctrl+C to interrupt current command
 					# On Windows, Ctrl+C is sent as \x03, on Unix it's also \x03
 					self.proc.write(b'\x03')  # Ctrl+C
-					self.proc.waitForBytesWritten(100)
 					
 					# Wait a moment for the interrupt to be processed, then send newline to get prompt back
 					# This ensures the shell returns to ready state and shows the prompt
@@ -364,7 +424,6 @@ class TerminalWidget(QtWidgets.QWidget):
 				# On Windows cmd.exe, after Ctrl+C, pressing Enter returns to prompt
 				newline = "\r\n" if self._is_windows else "\n"
 				self.proc.write(newline.encode())
-				self.proc.waitForBytesWritten(100)
 		except Exception as e:
 			print(f"[DEBUG] Error restoring prompt: {e}")
 
@@ -389,6 +448,7 @@ class TerminalWidget(QtWidgets.QWidget):
 			self._in_subsession = False
 			# Stop the output checking timer
 			self._adb_output_timer.stop()
+			self._flush_out()
 			self.view.appendPlainText("\n[adb shell exited]\n")
 		except Exception:
 			pass
@@ -433,7 +493,7 @@ class TerminalWidget(QtWidgets.QWidget):
 		process or an active ADB shell session. It includes special handling
 		for ADB shell commands and proper command echoing.
 		"""
-		msg = self.input.text() if hasattr(self, 'input') else ""
+		msg = self.input.text()
 		if not msg:
 			return
 		try:
@@ -455,13 +515,14 @@ class TerminalWidget(QtWidgets.QWidget):
 			
 			# If we're in an interactive adb shell subsession, route input there
 			if self._in_subsession and self._subproc is not None:
-				# Echo the command to the terminal (like a real terminal does)
+				# Echo the command to the terminal (like a real terminal does),
+				# after any output still waiting for the flush timer
+				self._flush_out()
 				self.view.appendPlainText(f"$ {line}")
 				# Send the command
+				# QProcess buffers the write and flushes it from the event loop;
+				# the reply arrives through readyRead and the output timer
 				self._subproc.write((line + "\n").encode())
-				self._subproc.waitForBytesWritten(100)
-				# Wait a moment for output to be available
-				self._subproc.waitForReadyRead(100)
 				self.input.clear()
 				return
 			
@@ -475,6 +536,8 @@ class TerminalWidget(QtWidgets.QWidget):
 			if parts and parts[0].lower() == "adb" and parts[-1].lower() == "shell":
 				print(f"[DEBUG] Starting ADB shell with args: {parts[1:]}")
 				self._subproc = QtCore.QProcess(self)
+				self._sub_out_decoder.reset()
+				self._sub_err_decoder.reset()
 				# Use SeparateChannels to read stdout and stderr separately for better prompt detection
 				self._subproc.setProcessChannelMode(QtCore.QProcess.SeparateChannels)
 				self._subproc.readyReadStandardOutput.connect(self._on_sub_out)
@@ -540,7 +603,6 @@ class TerminalWidget(QtWidgets.QWidget):
 			newline = "\r\n" if self._is_windows else "\n"
 			if self.proc is not None:
 				self.proc.write((msg + newline).encode())
-				self.proc.waitForBytesWritten(100)
 				self.input.clear()
 		except Exception as e:
 			self.view.appendPlainText(f"[terminal error] {e}")
@@ -579,7 +641,6 @@ class TerminalWidget(QtWidgets.QWidget):
 			p = QtCore.QProcess(self)
 			p.setProcessChannelMode(QtCore.QProcess.MergedChannels)
 			p.readyReadStandardOutput.connect(lambda p=p: self._append_proc_output(p))
-			p.readyReadStandardError.connect(lambda p=p: self._append_proc_output(p))
 			p.finished.connect(lambda _c, _s, p=p: p.deleteLater())
 			self.view.appendPlainText("> adb " + " ".join(final_args))
 			p.start("adb", final_args)
@@ -597,15 +658,14 @@ class TerminalWidget(QtWidgets.QWidget):
 			p (QtCore.QProcess): The process whose output to display
 		"""
 		try:
-			data = p.readAllStandardOutput().data() + p.readAllStandardError().data()
-			if data:
+			# Channels are merged, so stderr arrives on the single read channel
+			data = p.readAll()
+			if not data.isEmpty():
 				try:
-					text = data.decode(errors='replace')
+					text = bytes(data).decode(errors='replace')
 				except Exception:
 					text = str(data)
-				self.view.moveCursor(QtGui.QTextCursor.End)
-				self.view.insertPlainText(text)
-				self.view.moveCursor(QtGui.QTextCursor.End)
+				self._append_view(text)
 		except Exception:
 			pass
 
@@ -650,22 +710,17 @@ class TerminalWidget(QtWidgets.QWidget):
 		users see when opening a new command prompt window.
 		"""
 		try:
-			if not hasattr(self, 'view'):
-				return
-			# Only print when empty to avoid spamming
-			if self.view.toPlainText().strip():
+			# Only print when empty to avoid spamming; checked on the document
+			# rather than by copying its whole text out
+			if not self.view.document().isEmpty():
 				return
-			is_windows = platform.system().lower().startswith('win')
 			cwd = os.getcwd()
-			if is_windows:
-				ver = platform.version()
-				self.view.appendPlainText(f"Microsoft Windows [Version {ver}]")
+			if _IS_WINDOWS:
+				self.view.appendPlainText(f"Microsoft Windows [Version {_PLATFORM_VERSION}]")
 				self.view.appendPlainText("(c) Microsoft Corporation. All rights reserved.")
 				self.view.appendPlainText("")
 				self.view.appendPlainText(cwd + ">")
 			else:
-				user = os.environ.get('USER') or os.environ.get('USERNAME') or ''
-				host = platform.node()
-				self.view.appendPlainText(f"{user}@{host}:{cwd}$")
+				self.view.appendPlainText(f"{_USER}@{_HOST}:{cwd}$")
 		except Exception:
 			pass
@@ -31,10 +31,15 @@ Version: 1.0
 
 from __future__ import annotations
 
-from typing import Optional, List, Callable
+from typing import Optional, Deque, Dict, List, Tuple, Callable
+import codecs
 import os
 import platform
+import queue
 import re
+import threading
+import time
+from collections import defaultdict, deque
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -44,17 +49,306 @@ from adb_utils import (
 	shell as adb_shell, 
 	adb_version, 
 	wait_for_device,
-	start_interactive_shell,
-	stop_interactive_shell,
-	send_shell_command,
-	read_shell_output,
-	is_shell_running,
 	get_device_info,
 	check_device_root,
 	get_device_model,
 	get_device_android_version
 )
-from cmd_utils import TerminalWidget
+from cmd_utils import TerminalWidget, mono_font
+
+try:
+	from serial.tools import list_ports as _list_ports
+except Exception:  # pyserial missing; connecting reports it to the user
+	_list_ports = None
+
+# Verbose console tracing; set COMM_DEBUG=1 to enable. Checked before building
+# the message so hot output paths don't pay for formatting large buffers.
+_DEBUG = bool(os.environ.get("COMM_DEBUG"))
+
+# Grace period for the ADB shell to exit after 'exit' before it is killed
+_ADB_EXIT_WAIT_MS = 500
+
+# Received UART text is written to the log at most once per this interval
+_LOG_FLUSH_MS = 30
+
+# Lines kept in each port's log document; older lines are dropped by Qt. The
+# full per-port history lives in _port_logs.
+_LOG_MAX_BLOCKS = 5000
+
+# Driver receive queue requested for an open port (Windows only)
+_UART_RX_BUFFER_SIZE = 1 << 20
+
+# Characters of received text kept per UART port; the oldest chunks are
+# dropped beyond this
+_PORT_LOG_MAX_CHARS = 2 * 1024 * 1024
+
+
+# ANSI escape sequences (with ESC character) stripped from UART output.
+# Compiled once at import; _strip_ansi_codes runs on every UART poll.
+_ANSI_RE = re.compile(
+	# Standard CSI sequences: ESC[ followed by optional parameters and command
+	r'\x1b\[[0-9;]*[a-zA-Z]'
+	# SGR sequences (colors/formatting): ESC[ ... m
+	r'|\x1b\[[0-9;]*m'
+	# Erase sequences: ESC[ ... J or ESC[ ... K
+	r'|\x1b\[[0-9]*[JK]'
+	# Cursor movement: ESC[ ... A-H
+	r'|\x1b\[[0-9]*[ABCDEFGH]'
+	# Cursor position: ESC[ ... H or ESC[ ... f
+	r'|\x1b\[[0-9;]*[Hf]'
+	# Mode sequences: ESC[ ... h or ESC[ ... l
+	r'|\x1b\[[?0-9]*[hl]'
+	# Scroll region: ESC[ ... r
+	r'|\x1b\[[0-9]*[r]'
+	# OSC sequences: ESC] ... BEL
+	r'|\x1b\][^\x07]*\x07'
+	# ESC followed by single char commands (without [)
+	r'|\x1b[=<>?\(\)]'
+)
+
+# Corrupted/malformed sequences where the ESC byte was lost in transmission.
+# These patterns match common ANSI code formats that appear without ESC;
+# kept specific to avoid false matches with legitimate text.
+_CORRUPTED_RE = re.compile(
+	# Color/formatting codes: [number;numberm or [numberm
+	r'\[[0-9]+(;[0-9]+)*m'
+	# Erase commands: [numberK or [K or [numberJ or [J
+	r'|\[[0-9]*[JK]'
+	# Cursor position: [number;numberH or [H or [number;numberf or [f
+	r'|\[[0-9]*(;[0-9]+)*[Hf]'
+	# Mode sequences: [?numberh or [?numberl or [numberh or [numberl
+	r'|\[[?]?[0-9]*[hl]'
+	# Cursor movement: [numberA through [numberH
+	r'|\[[0-9]*[ABCDEFGH]'
+	# Scroll region: [number;numberr or [numberr
+	r'|\[[0-9]*(;[0-9]+)*r'
+	# Common corrupted patterns seen in UART output
+	r'|\[m[0-9]+'  # [m followed by numbers (corrupted reset + code)
+	r'|\[[0-9]+\['  # [number[ (nested/corrupted)
+)
+
+# Both pattern sets fused into one alternation so the text is scanned once.
+# ESC-prefixed alternatives come first, so at an ESC they win exactly as the
+# former first pass did. Chunks without any ESC use _CORRUPTED_RE alone.
+_ANSI_COMBINED_RE = re.compile(_ANSI_RE.pattern + '|' + _CORRUPTED_RE.pattern)
+
+# Android shell prompt patterns tried in order by _detect_android_prompt
+_ANDROID_PROMPT_RES = tuple(re.compile(p, re.MULTILINE) for p in (
+	r'root@[^:]+:/#\s*$',  # root@device:/#
+	r'[^@]+@[^:]+:/#\s*$',  # user@device:/#
+	r'#\s*$',               # Just #
+	r'\$\s*$',              # Just $
+	r'root@[^:]+:/#\s*',    # root@device:/# (with content after)
+	r'[^@]+@[^:]+:/#\s*',   # user@device:/# (with content after)
+	r'root@[^:]+:/#',       # root@device:/# (anywhere in text)
+	r'[^@]+@[^:]+:/#',      # user@device:/# (anywhere in text)
+	r'^#\s*',               # # at start of line
+	r'^\$\s*',              # $ at start of line
+	r'#\s*$',               # # at end of line
+	r'\$\s*$',              # $ at end of line
+))
+
+def _com_port_number(name: str) -> int:
+	"""Sort key for port names: COMn by n, anything else last."""
+	# Digits after the last "COM" (any case), as the pattern COM(\d+)$ would match
+	_, sep, num = name.upper().rpartition("COM")
+	return int(num) if sep and num.isdecimal() else 1_000_000
+
+# Serial port enumeration (SetupAPI on Windows) is reused for this long
+_COMPORTS_TTL_S = 1.0
+_comports_cache: Tuple[float, Optional[list]] = (0.0, None)
+
+
+def _comports_cached() -> list:
+	"""Return list_ports.comports(), reusing a result up to _COMPORTS_TTL_S old."""
+	global _comports_cache
+	if _list_ports is None:
+		return []
+	now = time.monotonic()
+	stamp, ports = _comports_cache
+	if ports is None or now - stamp >= _COMPORTS_TTL_S:
+		ports = list(_list_ports.comports())
+		_comports_cache = (now, ports)
+	return ports
+
+
+class _UartCharFilter(dict):
+	"""str.translate() table deciding which characters survive UART cleaning.
+
+	Keeps newline, carriage return and tab, printable ASCII, the Latin-1 range
+	(128-255) and any printable or whitespace Unicode character above that.
+	Drops other control characters, DEL, the replacement character U+FFFD,
+	zero-width characters (U+200B-U+200D, U+FEFF), the Private Use Area and
+	CJK Compatibility Ideographs. Decisions for code points above 255 are
+	computed on first sight and cached, so steady-state filtering never
+	leaves C code.
+	"""
+
+	def __missing__(self, code: int) -> Optional[int]:
+		if code == 0xFFFD:
+			keep = False
+		elif code == 10 or code == 13 or code == 9:  # \n, \r, \t
+			keep = True
+		elif 32 <= code <= 126 or 128 <= code <= 255:
+			keep = True
+		elif code > 255:
+			if 0xE000 <= code <= 0xF8FF or 0xF900 <= code <= 0xFAFF:
+				keep = False
+			else:
+				char = chr(code)
+				keep = char.isprintable() or char.isspace()
+		else:
+			keep = False
+		value = code if keep else None
+		self[code] = value
+		return value
+
+
+_UART_CHAR_FILTER = _UartCharFilter()
+for _code in range(256):
+	_UART_CHAR_FILTER[_code]
+del _code
+
+# ASCII control bytes dropped from raw UART data before decoding. ESC and BEL
+# are kept because the ANSI patterns need them; whatever is left of them after
+# stripping is removed by _UART_CHAR_FILTER.
+_DELETE_BYTES = bytes(b for b in range(32) if b not in (7, 9, 10, 13, 27)) + b'\x7f'
+
+
+class _UartCleaner(QtCore.QThread):
+	"""Background thread that cleans received UART text off the GUI thread.
+
+	The reader hands over raw chunks with submit(); each one is decoded and
+	cleaned by the console's cleaning function here and delivered back to the
+	GUI thread via the ``cleaned`` signal (queued across threads).
+	"""
+
+	cleaned = QtCore.Signal(str, str)  # port, cleaned text
+
+	def __init__(self, clean: Callable[[bytes], str], parent: Optional[QtCore.QObject] = None) -> None:
+		super().__init__(parent)
+		self._clean = clean
+		self._queue: "queue.Queue[Optional[Tuple[str, bytes]]]" = queue.Queue()
+
+	def submit(self, port: str, data: bytes) -> None:
+		self._queue.put((port, data))
+
+	def stop(self) -> None:
+		"""Finish the chunks already queued, then end the thread."""
+		self._queue.put(None)
+		self.wait()
+
+	def run(self) -> None:
+		while True:
+			item = self._queue.get()
+			if item is None:
+				return
+			port, data = item
+			try:
+				cleaned = self._clean(data)
+			except Exception:
+				continue
+			if cleaned:
+				self.cleaned.emit(port, cleaned)
+
+
+class _UartReader(QtCore.QThread):
+	"""Background thread that reads the serial port where no fd can be polled.
+
+	Used on Windows in place of a poll timer: each read blocks for at most the
+	port's read timeout, then takes everything else already buffered. Data is
+	handed straight to ``sink`` (the cleaner's submit), so received bytes never
+	pass through the GUI thread before they are cleaned. A read error ends the
+	thread and is reported through ``failed`` (queued to the GUI thread).
+	"""
+
+	failed = QtCore.Signal(str)
+
+	def __init__(self, serial_obj, port: str, sink: Callable[[str, bytes], None],
+			parent: Optional[QtCore.QObject] = None) -> None:
+		super().__init__(parent)
+		self._serial = serial_obj
+		self._port = port
+		self._sink = sink
+		self._stopped = threading.Event()
+
+	def stop(self) -> None:
+		"""End the thread; returns once the current read has timed out."""
+		self._stopped.set()
+		self.wait()
+
+	def run(self) -> None:
+		ser = self._serial
+		while not self._stopped.is_set():
+			try:
+				data = ser.read(min(ser.in_waiting or 1, 65536))
+				if data and ser.in_waiting:
+					# Drain whatever arrived during the read in the same batch
+					data += ser.read(min(ser.in_waiting, 65536))
+			except Exception as e:
+				if not self._stopped.is_set():
+					self.failed.emit(str(e))
+				return
+			if data:
+				self._sink(self._port, data)
+
+
+class _CmdPump(QtCore.QThread):
+	"""Background thread that writes a batch of UART commands at a fixed spacing.
+
+	Pacing runs off the GUI thread, so command timing does not depend on how
+	busy the event loop is. Each command is written, then the thread waits
+	``spacing_ms`` before the next one (and after the last, so completion is
+	reported one interval after the final write, as with the former timer).
+	"""
+
+	def __init__(self, write: Callable[[str], None], commands: List[str], spacing_ms: int,
+			on_complete: Optional[Callable[[], None]] = None, parent: Optional[QtCore.QObject] = None) -> None:
+		super().__init__(parent)
+		self._write = write
+		self._commands = list(commands)
+		self._spacing_s = max(50, int(spacing_ms)) / 1000.0
+		self._stopped = threading.Event()
+		self.on_complete = on_complete
+
+	def stop(self) -> None:
+		"""Abandon the remaining commands and end the thread."""
+		self._stopped.set()
+		self.wait()
+
+	def run(self) -> None:
+		for cmd in self._commands:
+			if self._stopped.is_set():
+				return
+			try:
+				self._write(cmd)
+			except Exception as e:
+				if _DEBUG:
+					print(f"[DEBUG] Error sending command '{cmd}': {e}")
+			if self._stopped.wait(self._spacing_s):
+				return
+
+
+class _AdbListSignals(QtCore.QObject):
+	"""Signal carrier for _AdbListWorker (QRunnable is not a QObject)."""
+
+	# List of (serial, label) pairs, or None if listing failed
+	listed = QtCore.Signal(object)
+
+
+class _AdbListWorker(QtCore.QRunnable):
+	"""Runs ``adb devices -l`` on a QThreadPool thread and reports the result."""
+
+	def __init__(self, signals: _AdbListSignals) -> None:
+		super().__init__()
+		self._signals = signals
+
+	def run(self) -> None:
+		try:
+			devs = adb_list_devices()
+		except Exception:
+			devs = None
+		self._signals.listed.emit(devs)
 
 
 class CommConsole(QtWidgets.QWidget):
@@ -94,6 +388,8 @@ class CommConsole(QtWidgets.QWidget):
 
 	def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
 		super().__init__(parent)
+		# Read by the input event filter, which is installed during _build_ui
+		self._serial = None  # type: ignore[assignment]
 		self._build_ui()
 		self._setup_uart()
 		# ADB-only prompt is printed when ADB protocol is selected
@@ -126,8 +422,14 @@ class CommConsole(QtWidgets.QWidget):
 		u.addWidget(QtWidgets.QLabel("Port:"))
 		self.uart_port_combo = QtWidgets.QComboBox()
 		u.addWidget(self.uart_port_combo)
-		# Track port changes to swap per-port logs
-		self.uart_port_combo.currentTextChanged.connect(self._on_port_changed)
+		# Track port changes to swap per-port logs; user changes are debounced
+		# so scrolling through the combo swaps the log once
+		self._pending_port = ""
+		self._port_change_timer = QtCore.QTimer(self)
+		self._port_change_timer.setSingleShot(True)
+		self._port_change_timer.setInterval(50)
+		self._port_change_timer.timeout.connect(self._apply_pending_port_change)
+		self.uart_port_combo.currentTextChanged.connect(self._schedule_port_change)
 		u.addWidget(QtWidgets.QLabel("Baud:"))
 		self.uart_baud = QtWidgets.QComboBox()
 		self.uart_baud.addItems(["9600", "19200", "38400", "57600", "115200", "230400", "460800", "921600"]) 
@@ -168,7 +470,46 @@ class CommConsole(QtWidgets.QWidget):
 		u.addWidget(self.uart_connect_btn)
 		self.proto_stack.addWidget(uart_controls)
 
-		# SSH controls page (placeholder)
+		# SSH and ADB control pages are built the first time they are selected;
+		# until then the stack holds empty stand-ins at their indexes
+		self._page_builders = {1: self._build_ssh_page, 2: self._build_adb_page}
+		for _ in self._page_builders:
+			self.proto_stack.addWidget(QtWidgets.QWidget())
+
+		# CMD terminals page (3 tabs, independent terminals) - lazy init
+		cmd_page = QtWidgets.QWidget()
+		cmd_layout = QtWidgets.QVBoxLayout(cmd_page)
+		cmd_layout.setContentsMargins(0, 0, 0, 0)
+		self.cmd_tabs = QtWidgets.QTabWidget()
+		self.cmd_terms: List[TerminalWidget] = []  # type: ignore[var-annotated]
+		placeholder = QtWidgets.QLabel("CMD terminals will start when selected…")
+		placeholder.setAlignment(QtCore.Qt.AlignCenter)
+		cmd_layout.addWidget(self.cmd_tabs)
+		cmd_layout.addWidget(placeholder)
+		self._cmd_placeholder = placeholder
+		self.proto_stack.addWidget(cmd_page)
+
+		# Distinct output log and input box
+		self.log = QtWidgets.QPlainTextEdit()
+		self.log.setReadOnly(True)
+		self.log.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+		self.log.setFont(mono_font())
+		self.log.setMinimumHeight(260)
+		self.log.setMaximumBlockCount(_LOG_MAX_BLOCKS)
+		self.log.document().setUndoRedoEnabled(False)
+		v.addWidget(self.log, 1)
+		# Document cursor reused by _append_log for received text
+		self._log_cursor = QtGui.QTextCursor(self.log.document())
+
+		self.input = QtWidgets.QPlainTextEdit()
+		self.input.setPlaceholderText("Type and press Enter to send. Shift+Enter for newline.")
+		self.input.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+		self.input.setFixedHeight(60)
+		self.input.installEventFilter(self)
+		v.addWidget(self.input, 0)
+
+	def _build_ssh_page(self) -> QtWidgets.QWidget:
+		"""SSH controls page (placeholder)."""
 		ssh_controls = QtWidgets.QWidget()
 		ssh = QtWidgets.QHBoxLayout(ssh_controls)
 		ssh.setContentsMargins(0, 0, 0, 0)
@@ -189,9 +530,10 @@ class CommConsole(QtWidgets.QWidget):
 		self.btn_ssh_connect = QtWidgets.QPushButton("Connect (todo)")
 		self.btn_ssh_connect.setEnabled(False)
 		ssh.addWidget(self.btn_ssh_connect)
-		self.proto_stack.addWidget(ssh_controls)
+		return ssh_controls
 
-		# ADB controls page (placeholder)
+	def _build_adb_page(self) -> QtWidgets.QWidget:
+		"""ADB controls page."""
 		adb_controls = QtWidgets.QWidget()
 		adb = QtWidgets.QHBoxLayout(adb_controls)
 		adb.setContentsMargins(0, 0, 0, 0)
@@ -201,7 +543,7 @@ class CommConsole(QtWidgets.QWidget):
 		self.adb_device_combo.setMinimumWidth(220)
 		adb.addWidget(self.adb_device_combo)
 		self.btn_adb_refresh = QtWidgets.QPushButton("Refresh")
-		self.btn_adb_refresh.clicked.connect(self._refresh_adb_devices)
+		self.btn_adb_refresh.clicked.connect(self._on_adb_refresh_clicked)
 		adb.addWidget(self.btn_adb_refresh)
 		adb.addStretch(1)
 		self.btn_adb_connect = QtWidgets.QPushButton("Connect")
@@ -209,44 +551,57 @@ class CommConsole(QtWidgets.QWidget):
 		self.btn_adb_connect.toggled.connect(self._on_adb_connect_toggle)
 		self.btn_adb_connect.setEnabled(is_adb_available())
 		adb.addWidget(self.btn_adb_connect)
-		self.proto_stack.addWidget(adb_controls)
-
-		# CMD terminals page (3 tabs, independent terminals) - lazy init
-		cmd_page = QtWidgets.QWidget()
-		cmd_layout = QtWidgets.QVBoxLayout(cmd_page)
-		cmd_layout.setContentsMargins(0, 0, 0, 0)
-		self.cmd_tabs = QtWidgets.QTabWidget()
-		self.cmd_terms: List[TerminalWidget] = []  # type: ignore[var-annotated]
-		placeholder = QtWidgets.QLabel("CMD terminals will start when selected…")
-		placeholder.setAlignment(QtCore.Qt.AlignCenter)
-		cmd_layout.addWidget(self.cmd_tabs)
-		cmd_layout.addWidget(placeholder)
-		self._cmd_placeholder = placeholder
-		self.proto_stack.addWidget(cmd_page)
-
-		# Distinct output log and input box
-		self.log = QtWidgets.QPlainTextEdit()
-		self.log.setReadOnly(True)
-		self.log.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
-		mono = QtGui.QFont("Consolas", 10)
-		self.log.setFont(mono)
-		self.log.setMinimumHeight(260)
-		v.addWidget(self.log, 1)
+		# Populate ADB devices so the page shows data when first selected
+		self._refresh_adb_devices()
+		return adb_controls
 
-		self.input = QtWidgets.QPlainTextEdit()
-		self.input.setPlaceholderText("Type and press Enter to send. Shift+Enter for newline.")
-		self.input.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
-		self.input.setFixedHeight(60)
-		self.input.installEventFilter(self)
-		v.addWidget(self.input, 0)
+	def _ensure_page(self, idx: int) -> None:
+		"""Replace the stand-in at idx with the real page if not built yet."""
+		builder = self._page_builders.pop(idx, None)
+		if builder is None:
+			return
+		stub = self.proto_stack.widget(idx)
+		self.proto_stack.insertWidget(idx, builder())
+		self.proto_stack.removeWidget(stub)
+		stub.deleteLater()
 
 	def _setup_uart(self) -> None:
 		self._serial = None  # type: ignore[assignment]
-		self._poll = QtCore.QTimer(self)
-		self._poll.setInterval(50)  # Reduced from 100ms to 50ms for faster response with long outputs
-		self._poll.timeout.connect(self._poll_uart)
-		# Per-port log buffers and current port pointer
-		self._port_logs = {}  # type: ignore[var-annotated]
+		# Read readiness notifier on the serial fd (POSIX); where there is no
+		# pollable descriptor (Windows) a reader thread is used instead
+		self._uart_notifier: Optional[QtCore.QSocketNotifier] = None
+		self._uart_reader: Optional[_UartReader] = None
+		# Port file descriptor read directly while the notifier is active
+		self._uart_fd: Optional[int] = None
+		# UTF-8 decoder for the open port, kept across reads so multi-byte
+		# characters split between chunks decode intact (used by the cleaner)
+		self._uart_decoder: Optional[codecs.IncrementalDecoder] = None
+		# Cleaning thread for received text; runs only while a port is open
+		self._uart_cleaner: Optional[_UartCleaner] = None
+		# Command batches being written by _CmdPump threads
+		self._cmd_pumps: List[_CmdPump] = []
+		app = QtCore.QCoreApplication.instance()
+		if app is not None:
+			app.aboutToQuit.connect(self._stop_uart_reader)
+			app.aboutToQuit.connect(self._stop_uart_cleaner)
+			app.aboutToQuit.connect(self._stop_cmd_pumps)
+		# Received UART text waiting to be written to the log; coalesced so a
+		# burst of reads costs one text-layout pass per flush interval
+		self._pending_log: List[str] = []
+		self._log_flush_timer = QtCore.QTimer(self)
+		self._log_flush_timer.setSingleShot(True)
+		self._log_flush_timer.setInterval(_LOG_FLUSH_MS)
+		self._log_flush_timer.timeout.connect(self._flush_log)
+		# Per-port log buffers (deque of received chunks capped by total size,
+		# joined only when shown) and current port pointer
+		self._port_logs: Dict[str, Deque[str]] = defaultdict(deque)
+		self._port_log_sizes: Dict[str, int] = defaultdict(int)
+		# Per-port log documents; switching ports swaps the document shown
+		# in self.log instead of re-laying out the stored text
+		self._port_docs: Dict[str, QtGui.QTextDocument] = {}
+		self._adb_doc: Optional[QtGui.QTextDocument] = None
+		# Protocol shown by _on_proto_changed (UART is selected at startup)
+		self._last_proto_idx = 0
 		self._current_port = ""
 		# UART capture mode (used to fetch snapshots without polluting console)
 		self._capture_active = False
@@ -255,61 +610,81 @@ class CommConsole(QtWidgets.QWidget):
 		self._capture_callback = None
 		self._capture_timeout = QtCore.QTimer(self)
 		self._capture_timeout.setSingleShot(True)
+		# Command batch sender shared by all send_commands() calls; batches
+		# arriving while one is being sent wait in _send_batches, in order
+		self._send_queue: Deque[bytes] = deque()
+		self._send_on_complete: Optional[Callable[[], None]] = None
+		self._send_batches: Deque[Tuple[List[bytes], int, Optional[Callable[[], None]]]] = deque()
+		self._send_timer = QtCore.QTimer(self)
+		self._send_timer.timeout.connect(self._flush_next_cmd)
 		self.refresh_ports()
 		# Default SOC USB identifier (Windows hwid format substring)
 		self._soc_port_id = "VID:PID=067B:23A3"
 		# ADB runtime state
 		self._adb_connected = False
 		self._adb_serial = None
-		self._adb_shell_process = None
-		self._adb_shell_timer = None  # type: ignore[assignment]
-		self._adb_cmd_timer = QtCore.QTimer(self)
-		self._adb_cmd_timer.setSingleShot(True)
-		# Initialize ADB shell timer for interactive sessions
-		self._adb_shell_timer = QtCore.QTimer(self)
-		self._adb_shell_timer.setInterval(50)  # Check every 50ms for output
-		self._adb_shell_timer.timeout.connect(self._check_adb_shell_output)
-		# Populate ADB devices initially so the page shows data when selected
-		self._refresh_adb_devices()
+		# Interactive 'adb shell' kept open for the session; commands go to its
+		# stdin and output arrives through readyRead
+		self._adb_shell_process: Optional[QtCore.QProcess] = None
+		self._adb_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+		# Device listing runs on the global thread pool; refresh requests that
+		# arrive in quick succession are coalesced by a short single-shot timer
+		self._adb_list_signals = _AdbListSignals(self)
+		self._adb_list_signals.listed.connect(self._on_adb_devices_listed)
+		self._adb_listing = False
+		self._adb_relist_pending = False
+		self._adb_refresh_timer = QtCore.QTimer(self)
+		self._adb_refresh_timer.setSingleShot(True)
+		self._adb_refresh_timer.setInterval(200)
+		self._adb_refresh_timer.timeout.connect(self._start_adb_listing)
 
 	def _on_proto_changed(self) -> None:
 		idx = self.proto_combo.currentIndex()
-		print(f"[DEBUG] Protocol changed to index: {idx}")
+		# Callers that set the combo index also call this directly; nothing
+		# changes when the protocol is already selected
+		if idx == self._last_proto_idx:
+			return
+		self._last_proto_idx = idx
+		if _DEBUG:
+			print(f"[DEBUG] Protocol changed to index: {idx}")
+		self._ensure_page(idx)
 		self.proto_stack.setCurrentIndex(idx)
 		# Clear only the input area, preserve log history
-		if hasattr(self, 'input'):
-			self.input.clear()
-		# Don't clear the log - preserve UART console history
+		self.input.clear()
+		# The log keeps one document per UART port and one for ADB; show the
+		# one for the selected protocol (CMD hides the log)
+		self._flush_log()
+		if idx == 2:
+			self._show_log_document(self._adb_document())
 		# When switching protocols, disconnect UART and clear settings
 		if idx != 0:
-			print(f"[DEBUG] Switching to non-UART protocol")
+			if _DEBUG:
+				print(f"[DEBUG] Switching to non-UART protocol")
 			self._uart_disconnect_if_needed()
 			self._reset_uart_controls(clear_ports=False)
 			# Disable Stop button when not on UART protocol
-			if hasattr(self, 'uart_stop_btn'):
-				self.uart_stop_btn.setEnabled(False)
+			self.uart_stop_btn.setEnabled(False)
 		else:
-			print(f"[DEBUG] Switching to UART protocol")
+			if _DEBUG:
+				print(f"[DEBUG] Switching to UART protocol")
 			# Selected UART: reset and repopulate fresh
 			self._reset_uart_controls(clear_ports=True)
+			# refresh_ports() notifies _on_port_changed once for the new selection
+			self._show_port_document(self._current_port)
 			self.refresh_ports()
-			port = self.uart_port_combo.currentText()
-			print(f"[DEBUG] Calling _on_port_changed with port: {port}")
-			self._on_port_changed(port)
 			# Update Stop button state based on connection status
-			if hasattr(self, 'uart_stop_btn'):
-				self.uart_stop_btn.setEnabled(self._serial is not None and hasattr(self._serial, 'is_open') and self._serial.is_open)
+			self.uart_stop_btn.setEnabled(self._serial is not None and hasattr(self._serial, 'is_open') and self._serial.is_open)
 		# When switching to ADB, refresh device list (no host prompt)
 		if idx == 2:
 			self._refresh_adb_devices()
 		# Lazy-create CMD terminals when selected
-		if idx == 3 and not getattr(self, 'cmd_terms', []):
+		if idx == 3 and not self.cmd_terms:
 			try:
 				for i in range(3):
 					term = TerminalWidget(parent=self)
 					self.cmd_terms.append(term)
 					self.cmd_tabs.addTab(term, f"CMD {i+1}")
-				if hasattr(self, '_cmd_placeholder') and self._cmd_placeholder is not None:
+				if self._cmd_placeholder is not None:
 					self._cmd_placeholder.setVisible(False)
 			except Exception:
 				pass
@@ -325,33 +700,30 @@ class CommConsole(QtWidgets.QWidget):
 		"""
 		try:
 			is_cmd = (idx == 3)
-			if hasattr(self, 'log'):
-				self.log.setVisible(not is_cmd)
-			if hasattr(self, 'input'):
-				self.input.setVisible(not is_cmd)
+			self.log.setVisible(not is_cmd)
+			self.input.setVisible(not is_cmd)
 			# Resize behavior: for CMD let the stack expand; for others keep it compact
-			if hasattr(self, 'proto_stack'):
-				if is_cmd:
-					self.proto_stack.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
-					self.proto_stack.setMinimumHeight(0)
-					self.proto_stack.setMaximumHeight(16777215)  # reset cap
-				else:
-					self.proto_stack.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
-					current = self.proto_stack.currentWidget()
-					try:
-						h = current.sizeHint().height() if current is not None else self.proto_stack.sizeHint().height()
-						# Guard against zero-height hints
-						h = max(44, h)
-					except Exception:
-						h = 64
-					self.proto_stack.setMinimumHeight(h)
-					self.proto_stack.setMaximumHeight(h)
-				self.proto_stack.updateGeometry()
-				lay = self.layout()
-				if lay is not None:
-					lay.invalidate()
+			if is_cmd:
+				self.proto_stack.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
+				self.proto_stack.setMinimumHeight(0)
+				self.proto_stack.setMaximumHeight(16777215)  # reset cap
+			else:
+				self.proto_stack.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+				current = self.proto_stack.currentWidget()
+				try:
+					h = current.sizeHint().height() if current is not None else self.proto_stack.sizeHint().height()
+					# Guard against zero-height hints
+					h = max(44, h)
+				except Exception:
+					h = 64
+				self.proto_stack.setMinimumHeight(h)
+				self.proto_stack.setMaximumHeight(h)
+			self.proto_stack.updateGeometry()
+			lay = self.layout()
+			if lay is not None:
+				lay.invalidate()
 			# When showing shared console again, ensure it regains space and focus
-			if not is_cmd and hasattr(self, 'log') and hasattr(self, 'input'):
+			if not is_cmd:
 				self.log.setMinimumHeight(260)
 				self.log.updateGeometry()
 				self.input.setFixedHeight(60)
@@ -360,10 +732,8 @@ class CommConsole(QtWidgets.QWidget):
 			# When entering CMD, focus the first terminal input if available
 			if is_cmd:
 				try:
-					if getattr(self, 'cmd_terms', None):
-						term = self.cmd_terms[0]
-						if hasattr(term, 'input'):
-							term.input.setFocus()
+					if self.cmd_terms:
+						self.cmd_terms[0].input.setFocus()
 				except Exception:
 					pass
 		except Exception:
@@ -372,24 +742,67 @@ class CommConsole(QtWidgets.QWidget):
 	def refresh_ports(self) -> None:
 		"""Refresh UART ports list."""
 		try:
-			from serial.tools import list_ports
-			ports = [p.device for p in list_ports.comports()] or ["COM1"]
-			self.uart_port_combo.clear()
-			self.uart_port_combo.addItems(ports)
+			ports = [p.device for p in _comports_cached()] or ["COM1"]
 		except Exception:
-			self.uart_port_combo.clear()
-			self.uart_port_combo.addItems(["COM1"]) 
+			ports = ["COM1"]
+		# Repopulate silently, then notify once for the resulting selection
+		combo = self.uart_port_combo
+		combo.blockSignals(True)
+		try:
+			combo.clear()
+			combo.addItems(ports)
+		finally:
+			combo.blockSignals(False)
+		# Supersedes any user change still waiting on the debounce timer
+		self._port_change_timer.stop()
+		self._on_port_changed(combo.currentText())
 
 	# ===== ADB integration =====
+	def _on_adb_refresh_clicked(self) -> None:
+		# An explicit refresh re-checks for adb instead of using the cached result
+		is_adb_available.cache_clear()
+		self._refresh_adb_devices()
+
 	def _refresh_adb_devices(self) -> None:
-		"""Refresh the list of ADB devices in the combo box."""
+		"""Refresh the list of ADB devices in the combo box (asynchronously)."""
+		self._adb_refresh_timer.start()
+
+	def _start_adb_listing(self) -> None:
+		if self._adb_listing:
+			# A listing is already running; list again once it reports back
+			self._adb_relist_pending = True
+			return
 		try:
 			self.adb_device_combo.clear()
 			if not is_adb_available():
 				self.adb_device_combo.addItem("adb not found")
 				self.btn_adb_connect.setEnabled(False)
 				return
-			devs = adb_list_devices()
+			self.adb_device_combo.addItem("Refreshing...")
+			if not self.btn_adb_connect.isChecked():
+				self.btn_adb_connect.setEnabled(False)
+			self._adb_listing = True
+			QtCore.QThreadPool.globalInstance().start(_AdbListWorker(self._adb_list_signals))
+		except Exception:
+			self._adb_listing = False
+			try:
+				self.adb_device_combo.clear()
+				self.adb_device_combo.addItem("Error listing devices")
+				self.btn_adb_connect.setEnabled(False)
+			except Exception:
+				pass
+
+	def _on_adb_devices_listed(self, devs: Optional[List[Tuple[str, str]]]) -> None:
+		"""Fill the device combo from a finished listing (GUI thread)."""
+		self._adb_listing = False
+		if self._adb_relist_pending:
+			self._adb_relist_pending = False
+			self._start_adb_listing()
+			return
+		try:
+			self.adb_device_combo.clear()
+			if devs is None:
+				raise RuntimeError("adb devices failed")
 			if not devs:
 				self.adb_device_combo.addItem("No devices")
 				self.btn_adb_connect.setEnabled(False)
@@ -421,194 +834,130 @@ class CommConsole(QtWidgets.QWidget):
 				# Simple version probe
 				_ = adb_version()
 				
-				# Start interactive ADB shell session using utility function
-				print(f"[DEBUG] Starting ADB shell for device: {serial}")
-				success, process, message = start_interactive_shell(serial)
+				# Start the interactive ADB shell session
+				if _DEBUG:
+					print(f"[DEBUG] Starting ADB shell for device: {serial}")
+				process = QtCore.QProcess(self)
+				process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+				process.readyReadStandardOutput.connect(self._on_adb_shell_output)
+				process.finished.connect(self._on_adb_shell_finished)
+				self._adb_decoder.reset()
+				process.start("adb", ["-s", str(serial), "shell"])
+				if not process.waitForStarted(3000):
+					process.deleteLater()
+					raise RuntimeError("Failed to start interactive shell")
 				
-				if not success:
-					raise RuntimeError(message)
-				
-				print(f"[DEBUG] {message}")
 				self._adb_shell_process = process
 				self._adb_connected = True
 				self._adb_serial = serial
 				self.btn_adb_connect.setText("Disconnect")
 				
-				# Start the output checking timer
-				self._adb_shell_timer.start()
-				
 				# Show connection message and device info
-				if hasattr(self, 'log'):
-					self.log.appendPlainText(f"[ADB] Connected to {serial}")
-					self.log.appendPlainText("[ADB] Starting interactive shell...")
-					
-					# Get and display device information
-					model = get_device_model(serial)
-					version = get_device_android_version(serial)
-					root_status = "Root" if check_device_root(serial) else "No Root"
-					
-					if model or version:
-						info_parts = []
-						if model:
-							info_parts.append(f"Model: {model}")
-						if version:
-							info_parts.append(f"Android: {version}")
-						info_parts.append(root_status)
-						self.log.appendPlainText(f"[ADB] Device Info: {', '.join(info_parts)}")
+				self.log.appendPlainText(f"[ADB] Connected to {serial}")
+				self.log.appendPlainText("[ADB] Starting interactive shell...")
 				
-				# Wait for initial prompt with more aggressive reading
-				print("[DEBUG] Waiting for initial ADB shell prompt...")
-				import time
-				for attempt in range(10):  # Try more times
-					success, stdout, stderr = read_shell_output(self._adb_shell_process)
-					if success and (stdout or stderr):
-						print(f"[DEBUG] Data received on attempt {attempt + 1}: stdout={repr(stdout)}, stderr={repr(stderr)}")
-						self._on_adb_shell_output()
-					else:
-						print(f"[DEBUG] No data ready on attempt {attempt + 1}")
-					
-					# Small delay between attempts
-					time.sleep(0.1)  # Shorter delay for faster response
-					
-					# Force repaint to show any output
-					if hasattr(self, 'log'):
-						self.log.repaint()
+				# Get and display device information
+				model = get_device_model(serial)
+				version = get_device_android_version(serial)
+				root_status = "Root" if check_device_root(serial) else "No Root"
 				
-				# Additional delayed reads to catch prompt that might come later
-				QtCore.QTimer.singleShot(200, self._on_adb_shell_output)
-				QtCore.QTimer.singleShot(500, self._on_adb_shell_output)
-				QtCore.QTimer.singleShot(1000, self._on_adb_shell_output)
-				
-				print("[DEBUG] Finished waiting for initial ADB shell prompt")
+				if model or version:
+					info_parts = []
+					if model:
+						info_parts.append(f"Model: {model}")
+					if version:
+						info_parts.append(f"Android: {version}")
+					info_parts.append(root_status)
+					self.log.appendPlainText(f"[ADB] Device Info: {', '.join(info_parts)}")
 				
 			except Exception as e:
-				print(f"[DEBUG] ADB connect error: {e}")
+				if _DEBUG:
+					print(f"[DEBUG] ADB connect error: {e}")
 				QtWidgets.QMessageBox.critical(self, "ADB Connect Failed", str(e))
 				self.btn_adb_connect.setChecked(False)
 		else:
-			# Disconnect ADB shell using utility function
-			if self._adb_shell_process:
-				print("[DEBUG] Stopping ADB shell process")
-				success, message = stop_interactive_shell(self._adb_shell_process)
-				print(f"[DEBUG] {message}")
-				self._adb_shell_process = None
-			
-			if self._adb_shell_timer:
-				self._adb_shell_timer.stop()
+			# Ask the shell to exit, then kill it if it does not in time
+			process = self._adb_shell_process
+			self._adb_shell_process = None
+			if process is not None:
+				if _DEBUG:
+					print("[DEBUG] Stopping ADB shell process")
+				if process.state() == QtCore.QProcess.Running:
+					process.write(b"exit\n")
+					if not process.waitForFinished(_ADB_EXIT_WAIT_MS):
+						process.kill()
+						process.waitForFinished(_ADB_EXIT_WAIT_MS)
+				# Keep whatever the shell printed while exiting
+				self._read_adb_shell(process)
+				process.deleteLater()
 			
+			self._flush_log()
 			self._adb_connected = False
 			self._adb_serial = None
 			self.btn_adb_connect.setText("Connect")
-			if hasattr(self, 'log'):
-				self.log.appendPlainText("[ADB] Disconnected")
+			self.log.appendPlainText("[ADB] Disconnected")
 
 	def _on_adb_shell_output(self) -> None:
-		"""Handle output from ADB shell process."""
-		try:
-			if self._adb_shell_process is None:
-				return
-			
-			# Check if process is still running using utility function
-			if not is_shell_running(self._adb_shell_process):
-				return
-			
-			# Read output using utility function
-			success, stdout, stderr = read_shell_output(self._adb_shell_process)
-			
-			if not success:
-				print(f"[DEBUG] Failed to read ADB shell output: {stderr}")
-				return
-			
-			# Process stdout
-			if stdout:
-				print(f"[DEBUG] ADB shell stdout: {repr(stdout)}")
-				
-				# Check if this looks like an Android shell prompt
-				if self._detect_android_prompt(stdout):
-					print(f"[DEBUG] Android prompt detected in ADB shell stdout: {repr(stdout)}")
-				
-				# Display the text immediately
-				if hasattr(self, 'log'):
-					self.log.moveCursor(QtGui.QTextCursor.End)
-					self.log.insertPlainText(stdout)
-					self.log.moveCursor(QtGui.QTextCursor.End)
-					self.log.repaint()
-			
-			# Process stderr
-			if stderr:
-				print(f"[DEBUG] ADB shell stderr: {repr(stderr)}")
-				
-				# Check if this looks like an Android shell prompt
-				if self._detect_android_prompt(stderr):
-					print(f"[DEBUG] Android prompt detected in ADB shell stderr: {repr(stderr)}")
-				
-				# Display the text immediately
-				if hasattr(self, 'log'):
-					self.log.moveCursor(QtGui.QTextCursor.End)
-					self.log.insertPlainText(stderr)
-					self.log.moveCursor(QtGui.QTextCursor.End)
-					self.log.repaint()
-					
-		except Exception as e:
-			print(f"[DEBUG] Error in _on_adb_shell_output: {e}")
+		"""readyRead slot for the running ADB shell process."""
+		process = self._adb_shell_process
+		if process is None:
+			return
+		self._read_adb_shell(process)
 
-	def _check_adb_shell_output(self) -> None:
-		"""Periodically check for ADB shell output to catch any missed prompts."""
-		try:
-			if self._adb_shell_process is not None and is_shell_running(self._adb_shell_process):
-				# Use utility function to check for output
-				success, stdout, stderr = read_shell_output(self._adb_shell_process)
-				
-				if success and (stdout or stderr):
-					print(f"[DEBUG] ADB shell timer check - found output: stdout={repr(stdout)}, stderr={repr(stderr)}")
-					self._on_adb_shell_output()
-				
-				# Force a repaint to ensure any buffered output is displayed
-				if hasattr(self, 'log'):
-					self.log.repaint()
-		except Exception as e:
-			print(f"[DEBUG] Error in _check_adb_shell_output: {e}")
+	def _read_adb_shell(self, process: QtCore.QProcess) -> None:
+		"""Queue output from an ADB shell process for the next log flush."""
+		text = self._adb_decoder.decode(process.readAll().data())
+		if not text:
+			return
+		if _DEBUG:
+			print(f"[DEBUG] ADB shell output: {repr(text)}")
+			if self._detect_android_prompt(text):
+				print(f"[DEBUG] Android prompt detected in ADB shell output: {repr(text)}")
+		doc = self._adb_document()
+		if self.log.document() is not doc:
+			# Another protocol's log is shown; keep the text with the session
+			cursor = QtGui.QTextCursor(doc)
+			cursor.movePosition(QtGui.QTextCursor.End)
+			cursor.insertText(text)
+			return
+		self._pending_log.append(text)
+		if not self._log_flush_timer.isActive():
+			self._log_flush_timer.start()
 
 	def _on_adb_shell_finished(self, exit_code: int, exit_status: int) -> None:
-		"""Handle ADB shell process finished."""
-		print(f"[DEBUG] ADB shell process finished with code: {exit_code}, status: {exit_status}")
-		if hasattr(self, 'log'):
-			self.log.appendPlainText(f"\n[ADB] Shell session ended (exit code: {exit_code})")
+		"""Handle the ADB shell process exiting on its own."""
+		process = self.sender()
+		if process is not self._adb_shell_process:
+			# Stopped by a disconnect, which already reset the state
+			return
+		if _DEBUG:
+			print(f"[DEBUG] ADB shell process finished with code: {exit_code}, status: {exit_status}")
+		self._on_adb_shell_output()
+		self._flush_log()
+		self.log.appendPlainText(f"\n[ADB] Shell session ended (exit code: {exit_code})")
 		# Reset connection state
+		self._adb_shell_process = None
+		process.deleteLater()
 		self._adb_connected = False
 		self._adb_serial = None
 		self.btn_adb_connect.setChecked(False)
 		self.btn_adb_connect.setText("Connect")
-		if self._adb_shell_timer:
-			self._adb_shell_timer.stop()
 
 	def _detect_android_prompt(self, text: str) -> bool:
 		"""Detect if the text contains an Android shell prompt."""
-		import re
-		prompt_patterns = [
-			r'root@[^:]+:/#\s*$',  # root@device:/#
-			r'[^@]+@[^:]+:/#\s*$',  # user@device:/#
-			r'#\s*$',               # Just #
-			r'\$\s*$',              # Just $
-			r'root@[^:]+:/#\s*',    # root@device:/# (with content after)
-			r'[^@]+@[^:]+:/#\s*',   # user@device:/# (with content after)
-			r'root@[^:]+:/#',       # root@device:/# (anywhere in text)
-			r'[^@]+@[^:]+:/#',      # user@device:/# (anywhere in text)
-			r'^#\s*',               # # at start of line
-			r'^\$\s*',              # $ at start of line
-			r'#\s*$',               # # at end of line
-			r'\$\s*$',              # $ at end of line
-		]
-		
-		for pattern in prompt_patterns:
-			if re.search(pattern, text, re.MULTILINE):
-				print(f"[DEBUG] ADB prompt pattern matched: {pattern}")
+		for pattern in _ANDROID_PROMPT_RES:
+			if pattern.search(text):
+				if _DEBUG:
+					print(f"[DEBUG] ADB prompt pattern matched: {pattern.pattern}")
 				return True
 		return False
 
 		# ===== UART handlers (class methods) =====
 	def _on_uart_connect_toggle(self, checked: bool) -> None:
 		if checked:
+			# Finish a just-made port selection before opening it
+			if self._port_change_timer.isActive():
+				self._apply_pending_port_change()
 			port = self.uart_port_combo.currentText()
 			try:
 				import serial
@@ -621,16 +970,29 @@ class CommConsole(QtWidgets.QWidget):
 				rx = self.uart_flow.currentText()
 				rtscts = (rx == "RTS/CTS")
 				xonxoff = (rx == "XON/XOFF")
-				self._serial = serial.Serial(port=port, baudrate=baud, bytesize=bytesize, parity=parity, stopbits=stopbits, rtscts=rtscts, xonxoff=xonxoff, timeout=0)
+				# Short read timeout instead of fully non-blocking (timeout=0): the
+				# reader thread (Windows) blocks at most this long per read, so it
+				# notices a stop request promptly
+				self._serial = serial.Serial(port=port, baudrate=baud, bytesize=bytesize, parity=parity, stopbits=stopbits, rtscts=rtscts, xonxoff=xonxoff, timeout=0.02)
+				if os.name == "nt":
+					# The default driver queue is small (4 KiB) and overflows during
+					# bursts at 921600 baud before the reader thread drains it
+					try:
+						self._serial.set_buffer_size(rx_size=_UART_RX_BUFFER_SIZE)
+					except Exception:
+						pass
+				# Let the port settle, then drop stale bytes buffered before we opened it
+				import time
+				time.sleep(0.05)
+				self._serial.reset_input_buffer()
 				self.uart_connect_btn.setText("Disconnect")
 				self.uart_stop_btn.setEnabled(True)  # Enable Stop button when connected
-				self._poll.start()
-				self._current_port = port
-				self._port_logs.setdefault(port, "")
+				self._uart_decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+				self._flush_log()
 				self._current_port = port
-				if hasattr(self, 'log'):
-					self.log.setPlainText(self._port_logs.get(port, ""))
-					self.log.moveCursor(QtGui.QTextCursor.End)
+				self._show_port_document(port)
+				self._start_uart_cleaner()
+				self._start_uart_reader()
 			except ImportError:
 				QtWidgets.QMessageBox.critical(
 					self,
@@ -647,22 +1009,30 @@ class CommConsole(QtWidgets.QWidget):
 				QtWidgets.QMessageBox.critical(self, "Open Port Failed", msg)
 				self.uart_connect_btn.setChecked(False)
 		else:
-			self._poll.stop()
+			self._stop_uart_reader()
+			# Pump threads write to the port; stop them before it closes
+			self._stop_cmd_pumps()
 			try:
 				if self._serial is not None:
 					self._serial.close()
 					self._serial = None
 			except Exception:
 				pass
+			self._stop_uart_cleaner()
+			# Any incomplete trailing sequence is dropped, as errors='ignore' would
+			self._uart_decoder = None
 			self.uart_connect_btn.setText("Connect")
 			self.uart_stop_btn.setEnabled(False)  # Disable Stop button when disconnected
 
 	def _on_uart_clear(self) -> None:
 		try:
-			port = self.uart_port_combo.currentText()
-			self._port_logs[port] = ""
-			if hasattr(self, 'log'):
-				self.log.clear()
+			# The log shows the current port's document, which may lag the
+			# combo text while a port change is debounced
+			port = self._current_port
+			self._port_logs[port].clear()
+			self._port_log_sizes[port] = 0
+			self._pending_log.clear()
+			self.log.clear()
 		except Exception:
 			pass
 
@@ -674,35 +1044,24 @@ class CommConsole(QtWidgets.QWidget):
 				self._serial.write(b'\x03')
 				# Also send a newline to ensure the interrupt is processed
 				self._serial.write(b'\n')
-				port = self.uart_port_combo.currentText()
-				if hasattr(self, 'log'):
-					self.log.appendPlainText("\n[Interrupt] Ctrl+C sent to stop command")
-					self.log.moveCursor(QtGui.QTextCursor.End)
+				log = self.log
+				log.appendPlainText("\n[Interrupt] Ctrl+C sent to stop command")
+				log.moveCursor(QtGui.QTextCursor.End)
 		except Exception as e:
-			print(f"[DEBUG] Error sending interrupt signal: {e}")
-			if hasattr(self, 'log'):
-				self.log.appendPlainText(f"\n[Error] Failed to send interrupt: {e}")
+			if _DEBUG:
+				print(f"[DEBUG] Error sending interrupt signal: {e}")
+			self.log.appendPlainText(f"\n[Error] Failed to send interrupt: {e}")
 
 	def find_linux_port(self, soc_port_id: Optional[str] = None) -> Optional[str]:
 		try:
-			from serial.tools import list_ports
 			needle = (soc_port_id or self._soc_port_id).strip()
-			candidates: List[str] = []
-			for p in list_ports.comports():
-				try:
-					hwid = getattr(p, 'hwid', '') or ''
-					if needle and needle in hwid:
-						candidates.append(p.device)
-				except Exception:
-					pass
+			if not needle:
+				return None
+			candidates = [p.device for p in _comports_cached() if needle in (getattr(p, 'hwid', '') or '')]
 			if not candidates:
 				return None
-			def _com_num(name: str) -> int:
-				import re
-				m = re.search(r"COM(\d+)$", name.upper())
-				return int(m.group(1)) if m else 1_000_000
-			candidates.sort(key=_com_num)
-			return candidates[0]
+			# Lowest COM number wins; min() keeps the first of equal keys, as the sort did
+			return min(candidates, key=_com_port_number)
 		except Exception:
 			return None
 
@@ -725,25 +1084,42 @@ class CommConsole(QtWidgets.QWidget):
 			if on_complete:
 				on_complete()
 			return
-		queue = list(commands)
-		timer = QtCore.QTimer(self)
-		timer.setInterval(max(50, int(spacing_ms)))
-		def _flush_next():
-			if not queue:
-				timer.stop()
-				if on_complete:
-					on_complete()
-				return
-			cmd = queue.pop(0)
-			try:
-				if self._serial is not None:
-					self._serial.write((cmd + "\n").encode())
-					# Don't echo command - only show device response
-			except Exception:
-				pass
-		timer.timeout.connect(_flush_next)
-		timer.start()
-		_flush_next()
+		# Encoded once up front; each timer tick is then a single write
+		batch = ([(cmd + "\n").encode() for cmd in commands], spacing_ms, on_complete)
+		# One timer serves every batch; a batch sent while another is in
+		# flight runs after it, so no command or on_complete is dropped
+		if self._send_timer.isActive():
+			self._send_batches.append(batch)
+			return
+		self._start_send_batch(*batch)
+
+	def _start_send_batch(self, lines: List[bytes], spacing_ms: int, on_complete: Optional[Callable[[], None]]) -> None:
+		self._send_queue = deque(lines)
+		self._send_on_complete = on_complete
+		self._send_timer.setInterval(max(50, int(spacing_ms)))
+		self._send_timer.start()
+		self._flush_next_cmd()
+
+	def _flush_next_cmd(self) -> None:
+		"""Write the next queued command from send_commands (timer slot)."""
+		if not self._send_queue:
+			self._send_timer.stop()
+			on_complete = self._send_on_complete
+			self._send_on_complete = None
+			# Start the next waiting batch before the callback, so batches the
+			# callback sends queue behind those already waiting
+			if self._send_batches:
+				self._start_send_batch(*self._send_batches.popleft())
+			if on_complete:
+				on_complete()
+			return
+		line = self._send_queue.popleft()
+		try:
+			if self._serial is not None:
+				self._serial.write(line)
+				# Don't echo command - only show device response
+		except Exception:
+			pass
 
 	def disconnect_serial(self) -> None:
 		self._uart_disconnect_if_needed()
@@ -752,43 +1128,80 @@ class CommConsole(QtWidgets.QWidget):
 		if self.uart_connect_btn.isChecked():
 			self.uart_connect_btn.setChecked(False)
 
+	def _schedule_port_change(self, port: str) -> None:
+		self._pending_port = port
+		self._port_change_timer.start()
+
+	def _apply_pending_port_change(self) -> None:
+		self._port_change_timer.stop()
+		self._on_port_changed(self._pending_port)
+
 	def _on_port_changed(self, port: str) -> None:
 		try:
-			prev = getattr(self, '_current_port', '')
-			if prev and hasattr(self, 'log'):
-				self._port_logs[prev] = self.log.toPlainText()
+			# Pending text belongs to the outgoing port's document
+			self._flush_log()
 			self._current_port = port
-			if hasattr(self, 'log'):
-				# Don't replace the entire log content - preserve existing content
-				# Only append port-specific content if it exists and is different
-				port_content = self._port_logs.get(port, "")
-				current_content = self.log.toPlainText()
-				
+			if _DEBUG:
 				print(f"[DEBUG] Port changed to: {port}")
-				print(f"[DEBUG] Port content length: {len(port_content)}")
-				print(f"[DEBUG] Current content length: {len(current_content)}")
-				
-				# If switching to a port that has content and current log is empty, load port content
-				if port_content and not current_content.strip():
-					print(f"[DEBUG] Loading port content (log was empty)")
-					self.log.setPlainText(port_content)
-				# If port has content and it's not already in the current log, append it
-				elif port_content and port_content not in current_content:
-					print(f"[DEBUG] Appending port content")
-					self.log.appendPlainText(f"\n--- Port {port} Content ---")
-					self.log.appendPlainText(port_content)
-				# If port has no content but current log has content, keep current content
-				elif not port_content and current_content.strip():
-					print(f"[DEBUG] Port has no content, keeping current content")
-					# Do nothing - keep current content
-				else:
-					print(f"[DEBUG] No port content to load/append")
-				
-				self.log.moveCursor(QtGui.QTextCursor.End)
+			# Other protocols keep their own log; returning to UART shows this port
+			if self._last_proto_idx == 0:
+				self._show_port_document(port)
 		except Exception as e:
-			print(f"[DEBUG] Error in _on_port_changed: {e}")
+			if _DEBUG:
+				print(f"[DEBUG] Error in _on_port_changed: {e}")
 			pass
 
+	def _new_log_document(self) -> QtGui.QTextDocument:
+		"""Create a document configured like the log's own."""
+		doc = QtGui.QTextDocument(self)
+		doc.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(doc))
+		doc.setDefaultFont(self.log.font())
+		doc.setMaximumBlockCount(_LOG_MAX_BLOCKS)
+		doc.setUndoRedoEnabled(False)
+		return doc
+
+	def _port_document(self, port: str) -> QtGui.QTextDocument:
+		"""Return the log document for a port, creating it on first use."""
+		doc = self._port_docs.get(port)
+		if doc is None:
+			doc = self._port_docs[port] = self._new_log_document()
+		return doc
+
+	def _adb_document(self) -> QtGui.QTextDocument:
+		"""Return the ADB session's log document, creating it on first use."""
+		if self._adb_doc is None:
+			self._adb_doc = self._new_log_document()
+		return self._adb_doc
+
+	def _show_port_document(self, port: str) -> None:
+		"""Show a port's document in the log and scroll to its end."""
+		self._show_log_document(self._port_document(port))
+
+	def _show_log_document(self, doc: QtGui.QTextDocument) -> None:
+		"""Show a document in the log and scroll to its end."""
+		log = self.log
+		if log.document() is not doc:
+			log.setDocument(doc)
+			self._log_cursor = QtGui.QTextCursor(doc)
+		log.moveCursor(QtGui.QTextCursor.End)
+
+	def _append_log(self, text: str) -> None:
+		"""Append raw text at the end of the log (no implicit newline).
+
+		Inserts through a cached document cursor rather than moving the
+		widget's cursor, and keeps the view pinned to the bottom only if it
+		was already there, so scrolling back through output is not undone.
+		"""
+		if not text:
+			return
+		bar = self.log.verticalScrollBar()
+		follow = bar.value() >= bar.maximum()
+		cursor = self._log_cursor
+		cursor.movePosition(QtGui.QTextCursor.End)
+		cursor.insertText(text)
+		if follow:
+			bar.setValue(bar.maximum())
+
 	def _strip_ansi_codes(self, text: str) -> str:
 		"""Remove ANSI escape sequences from text.
 		
@@ -799,52 +1212,14 @@ class CommConsole(QtWidgets.QWidget):
 		Handles both standard ANSI codes (with ESC character) and corrupted
 		sequences where the ESC character may be missing during UART transmission.
 		"""
-		# First, remove standard ANSI escape sequences with ESC character
-		ansi_pattern = re.compile(
-			# Standard CSI sequences: ESC[ followed by optional parameters and command
-			r'\x1b\[[0-9;]*[a-zA-Z]'
-			# SGR sequences (colors/formatting): ESC[ ... m
-			r'|\x1b\[[0-9;]*m'
-			# Erase sequences: ESC[ ... J or ESC[ ... K
-			r'|\x1b\[[0-9]*[JK]'
-			# Cursor movement: ESC[ ... A-H
-			r'|\x1b\[[0-9]*[ABCDEFGH]'
-			# Cursor position: ESC[ ... H or ESC[ ... f
-			r'|\x1b\[[0-9;]*[Hf]'
-			# Mode sequences: ESC[ ... h or ESC[ ... l
-			r'|\x1b\[[?0-9]*[hl]'
-			# Scroll region: ESC[ ... r
-			r'|\x1b\[[0-9]*[r]'
-			# OSC sequences: ESC] ... BEL
-			r'|\x1b\][^\x07]*\x07'
-			# ESC followed by single char commands (without [)
-			r'|\x1b[=<>?\(\)]'
-		)
-		cleaned = ansi_pattern.sub('', text)
-		
-		# Second pass: Remove corrupted/malformed sequences where ESC is missing
-		# These patterns match common ANSI code formats that appear without ESC
-		# Be more specific to avoid false matches with legitimate text
-		corrupted_pattern = re.compile(
-			# Color/formatting codes: [number;numberm or [numberm
-			r'\[[0-9]+(;[0-9]+)*m'
-			# Erase commands: [numberK or [K or [numberJ or [J
-			r'|\[[0-9]*[JK]'
-			# Cursor position: [number;numberH or [H or [number;numberf or [f
-			r'|\[[0-9]*(;[0-9]+)*[Hf]'
-			# Mode sequences: [?numberh or [?numberl or [numberh or [numberl
-			r'|\[[?]?[0-9]*[hl]'
-			# Cursor movement: [numberA through [numberH
-			r'|\[[0-9]*[ABCDEFGH]'
-			# Scroll region: [number;numberr or [numberr
-			r'|\[[0-9]*(;[0-9]+)*r'
-			# Common corrupted patterns seen in UART output
-			r'|\[m[0-9]+'  # [m followed by numbers (corrupted reset + code)
-			r'|\[[0-9]+\['  # [number[ (nested/corrupted)
-		)
-		cleaned = corrupted_pattern.sub('', cleaned)
-		
-		return cleaned
+		# Every pattern begins with ESC or '['; locate ESC first (a C-level
+		# scan) and only try the alternatives that can actually match
+		if '\x1b' in text:
+			# Single pass over both standard (ESC-prefixed) and corrupted sequences
+			return _ANSI_COMBINED_RE.sub('', text)
+		if '[' in text:
+			return _CORRUPTED_RE.sub('', text)
+		return text
 
 	def _clean_uart_text(self, text: str) -> str:
 		"""Clean UART text by removing ANSI codes, non-printable characters, and invalid UTF-8 replacements.
@@ -855,54 +1230,40 @@ class CommConsole(QtWidgets.QWidget):
 		3. Filters out non-printable control characters (except common ones like \n, \r, \t)
 		4. Removes other problematic characters
 		"""
-		# First strip ANSI codes
-		cleaned = self._strip_ansi_codes(text)
-		
-		# Remove Unicode replacement character (U+FFFD) - appears as or ? in boxes
-		cleaned = cleaned.replace('\ufffd', '')
-		cleaned = cleaned.replace('\uFFFD', '')
-		
-		# Remove other common problematic Unicode characters
-		# Zero-width characters
-		cleaned = cleaned.replace('\u200b', '')  # Zero-width space
-		cleaned = cleaned.replace('\u200c', '')  # Zero-width non-joiner
-		cleaned = cleaned.replace('\u200d', '')  # Zero-width joiner
-		cleaned = cleaned.replace('\ufeff', '')  # Zero-width no-break space
-		
-		# Filter out non-printable control characters except common ones
-		# Keep: \n (newline), \r (carriage return), \t (tab)
-		result = []
-		for char in cleaned:
-			code = ord(char)
-			# Skip Unicode replacement character (U+FFFD = 65533) - question mark in box
-			if code == 0xFFFD:
-				continue
-			
-			# Keep common control characters
-			if code == 10 or code == 13 or code == 9:  # \n, \r, \t
-				result.append(char)
-			# Keep printable ASCII (32-126)
-			elif code >= 32 and code <= 126:
-				result.append(char)
-			# Keep extended ASCII (128-255) - may include accented characters
-			elif code >= 128 and code <= 255:
-				result.append(char)
-			# For Unicode characters above 255
-			elif code > 255:
-				# Skip private use area and other non-printable ranges
-				if code >= 0xE000 and code <= 0xF8FF:  # Private Use Area
-					continue
-				elif code >= 0xF900 and code <= 0xFAFF:  # CJK Compatibility Ideographs (may cause issues)
-					continue
-				# Keep printable Unicode characters
-				if char.isprintable() or char.isspace():
-					result.append(char)
-		
-		return ''.join(result)
+		# Strip ANSI codes, then filter every remaining character through a
+		# C-level translate table (see _UartCharFilter for the keep/drop rules)
+		return self._strip_ansi_codes(text).translate(_UART_CHAR_FILTER)
+
+	def _clean_uart_bytes(self, data: bytes) -> str:
+		"""Decode a raw UART chunk and clean it (see _clean_uart_text)."""
+		# Drop ASCII control bytes with a C-level byte table before decoding;
+		# errors='ignore' drops invalid UTF-8 bytes instead of producing
+		# replacement characters and cannot raise
+		data = data.translate(None, _DELETE_BYTES)
+		decoder = self._uart_decoder
+		if data.isascii():
+			# Most console output is plain ASCII: decode it directly unless
+			# the decoder holds the start of a character split across reads
+			if decoder is None or not decoder.getstate()[0]:
+				text = data.decode('ascii')
+			else:
+				text = decoder.decode(data)
+			# With no ESC or BEL left there is nothing the character filter
+			# would drop, so only bracket fragments need stripping
+			if b'\x1b' not in data and b'\x07' not in data:
+				return self._strip_ansi_codes(text)
+			return self._clean_uart_text(text)
+		text = decoder.decode(data) if decoder is not None else data.decode('utf-8', errors='ignore')
+		return self._clean_uart_text(text)
 
 	def _reset_uart_controls(self, clear_ports: bool) -> None:
 		if clear_ports:
-			self.uart_port_combo.clear()
+			# Callers repopulate via refresh_ports(), which notifies once
+			self.uart_port_combo.blockSignals(True)
+			try:
+				self.uart_port_combo.clear()
+			finally:
+				self.uart_port_combo.blockSignals(False)
 		self.uart_baud.setCurrentText("921600")
 		self.uart_databits.setCurrentText("8")
 		self.uart_parity.setCurrentText("None")
@@ -911,86 +1272,190 @@ class CommConsole(QtWidgets.QWidget):
 
 	def _poll_uart(self) -> None:
 		try:
-			if self._serial is not None:
+			fd = self._uart_fd
+			if self._serial is not None and fd is not None:
 				# Read all available data in a loop to handle long outputs
 				# This ensures we capture all data even if it arrives faster than polling
 				max_reads_per_poll = 100  # Prevent infinite loop
 				read_count = 0
-				total_text = ""
+				# Read results are kept as-is; a drained port usually takes one
+				# read, which is then passed on without any copy
+				chunks: List[bytes] = []
 				
-				while self._serial.in_waiting > 0 and read_count < max_reads_per_poll:
-					# Read available bytes (up to 64KB per read to handle large outputs)
-					bytes_to_read = min(self._serial.in_waiting, 65536)
-					data = self._serial.read(bytes_to_read)
-					if data:
-						try:
-							# Try UTF-8 first, then fallback to latin-1 (which can decode any byte)
-							# This avoids replacement characters from invalid UTF-8
-							try:
-								text = data.decode('utf-8', errors='ignore')
-							except Exception:
-								# If UTF-8 fails completely, try latin-1 (maps bytes 0-255 directly)
-								text = data.decode('latin-1', errors='ignore')
-							total_text += text
-						except Exception:
-							# Last resort: decode as latin-1 which always works
-							try:
-								text = data.decode('latin-1', errors='ignore')
-								total_text += text
-							except Exception:
-								# If all else fails, skip this data
-								pass
+				# POSIX: pyserial configures the port so a read returns at once
+				# with whatever is buffered, so read the fd directly for up to
+				# 64KB per call - one syscall per read and no in_waiting query.
+				# A short read means the port is drained.
+				while read_count < max_reads_per_poll:
+					try:
+						data = os.read(fd, 65536)
+					except BlockingIOError:
+						break
+					if not data:
+						if read_count == 0:
+							# Notifier fired but nothing to read: the device went
+							# away (same check pyserial's read() makes)
+							raise OSError("device reports readiness to read but returned no data")
+						break
+					chunks.append(data)
 					read_count += 1
-					
-					# Small delay to allow more data to arrive if streaming
-					if self._serial.in_waiting > 0 and read_count < max_reads_per_poll:
-						import time
-						time.sleep(0.001)  # 1ms delay to allow buffer to fill
+					if len(data) < 65536:
+						break
 				
-				# Update UI with all collected text at once (more efficient)
-				if total_text:
-					# Clean text: remove ANSI codes, non-printable chars, and invalid UTF-8 replacements
-					cleaned_text = self._clean_uart_text(total_text)
-					port = self.uart_port_combo.currentText()
-					# Store cleaned text in port logs
-					self._port_logs[port] = self._port_logs.get(port, "") + cleaned_text
-					if hasattr(self, 'log'):
-						self.log.moveCursor(QtGui.QTextCursor.End)
-						self.log.insertPlainText(cleaned_text)
-						self.log.moveCursor(QtGui.QTextCursor.End)
+				# Hand the whole batch to the cleaning thread at once (decoding
+				# happens there too); it comes back through _on_uart_text on the
+				# GUI thread
+				if chunks:
+					data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+					# Tracked by _on_port_changed; avoids a Qt call and QString
+					# conversion on every read
+					port = self._current_port
+					if self._uart_cleaner is not None:
+						self._uart_cleaner.submit(port, data)
+					else:
+						self._on_uart_text(port, self._clean_uart_bytes(data))
 		except Exception as e:
-			self._poll.stop()
+			self._on_uart_read_failed(str(e))
+
+	def _on_uart_read_failed(self, error: str) -> None:
+		"""Close the port after a read error and tell the user."""
+		self._stop_uart_reader()
+		self._stop_cmd_pumps()
+		try:
+			if self._serial is not None:
+				self._serial.close()
+				self._serial = None
+		except Exception:
+			pass
+		QtWidgets.QMessageBox.warning(self, "Serial Disconnected", f"Serial port error: {error}\nThe connection has been closed.")
+		self.uart_connect_btn.setChecked(False)
+		self.uart_stop_btn.setEnabled(False)  # Disable Stop button on error/disconnect
+
+	def _on_uart_text(self, port: str, cleaned_text: str) -> None:
+		"""Store cleaned UART text and queue it for the next log flush (GUI thread)."""
+		self._store_port_log(port, cleaned_text)
+		if port != self._current_port:
+			# Text still in flight from before a port switch goes straight to
+			# its own port's document
+			cursor = QtGui.QTextCursor(self._port_document(port))
+			cursor.movePosition(QtGui.QTextCursor.End)
+			cursor.insertText(cleaned_text)
+			return
+		self._pending_log.append(cleaned_text)
+		if not self._log_flush_timer.isActive():
+			self._log_flush_timer.start()
+
+	def _flush_log(self) -> None:
+		"""Write all queued UART text to the log in one insert and one repaint."""
+		if not self._pending_log:
+			return
+		text = "".join(self._pending_log)
+		self._pending_log.clear()
+		log = self.log
+		log.setUpdatesEnabled(False)
+		try:
+			self._append_log(text)
+		finally:
+			log.setUpdatesEnabled(True)
+
+	def _store_port_log(self, port: str, text: str) -> None:
+		"""Append text to a port's log, dropping the oldest chunks over the cap."""
+		chunks = self._port_logs[port]
+		chunks.append(text)
+		size = self._port_log_sizes[port] + len(text)
+		# Always keep the newest chunk, even if it alone exceeds the cap
+		while size > _PORT_LOG_MAX_CHARS and len(chunks) > 1:
+			size -= len(chunks.popleft())
+		self._port_log_sizes[port] = size
+
+	def get_port_log(self, port: str) -> str:
+		"""Return the full stored log text for a port."""
+		return "".join(self._port_logs.get(port, ()))
+
+	def _start_uart_reader(self) -> None:
+		"""Start delivering received bytes for the open port to the cleaner.
+
+		On POSIX the serial port is a pollable file descriptor, so a
+		QSocketNotifier wakes the event loop only when bytes are available
+		and _poll_uart reads them. Otherwise a _UartReader thread does
+		blocking reads off the GUI thread.
+		"""
+		if os.name != "nt":
 			try:
-				if self._serial is not None:
-					self._serial.close()
-					self._serial = None
+				fd = self._serial.fileno()
+				notifier = QtCore.QSocketNotifier(fd, QtCore.QSocketNotifier.Read, self)
+				notifier.activated.connect(lambda *_: self._poll_uart())
+				self._uart_notifier = notifier
+				self._uart_fd = fd
+				return
 			except Exception:
-				pass
-			QtWidgets.QMessageBox.warning(self, "Serial Disconnected", f"Serial port error: {str(e)}\nThe connection has been closed.")
-			self.uart_connect_btn.setChecked(False)
-			self.uart_stop_btn.setEnabled(False)  # Disable Stop button on error/disconnect
+				self._uart_notifier = None
+		reader = _UartReader(self._serial, self._current_port, self._uart_cleaner.submit, self)
+		reader.failed.connect(self._on_uart_read_failed)
+		self._uart_reader = reader
+		reader.start()
+
+	def _stop_uart_reader(self) -> None:
+		"""Stop reading; must run before the serial port is closed."""
+		reader = self._uart_reader
+		if reader is not None:
+			self._uart_reader = None
+			reader.stop()
+			reader.deleteLater()
+		self._uart_fd = None
+		notifier = self._uart_notifier
+		if notifier is not None:
+			self._uart_notifier = None
+			notifier.setEnabled(False)
+			notifier.deleteLater()
+
+	def pause_uart_reading(self, port: str) -> bool:
+		"""Stop reading the open UART if it is port, so another handle gets its replies.
+
+		Returns True if reading was paused; call resume_uart_reading() after.
+		"""
+		if self._serial is None or port != self._current_port:
+			return False
+		self._stop_uart_reader()
+		return True
+
+	def resume_uart_reading(self) -> None:
+		"""Restart reading after pause_uart_reading(), if the port is still open."""
+		if self._serial is not None and self._uart_reader is None and self._uart_notifier is None:
+			self._start_uart_reader()
+
+	def _start_uart_cleaner(self) -> None:
+		if self._uart_cleaner is None:
+			self._uart_cleaner = _UartCleaner(self._clean_uart_bytes, self)
+			self._uart_cleaner.cleaned.connect(self._on_uart_text)
+			self._uart_cleaner.start()
+
+	def _stop_uart_cleaner(self) -> None:
+		cleaner = self._uart_cleaner
+		if cleaner is not None:
+			self._uart_cleaner = None
+			cleaner.stop()
+			cleaner.deleteLater()
 
 	def _on_send(self) -> None:
 		# Get all lines from input (support multiple commands like TeraTerm)
-		input_text = self.input.toPlainText() if hasattr(self, 'input') else ""
+		input_text = self.input.toPlainText()
 		if not input_text:
 			return
 		
 		# Split into lines and filter out empty lines
 		lines = [line.strip() for line in input_text.split("\n") if line.strip()]
 		if not lines:
-			if hasattr(self, 'input'):
-				self.input.clear()
+			self.input.clear()
 			return
 		
 		try:
-			idx = self.proto_combo.currentIndex() if hasattr(self, 'proto_combo') else 0
+			idx = self.proto_combo.currentIndex()
 			# Only handle UART and ADB here; CMD terminals have their own handler
 			if idx not in (0, 2):
-				if hasattr(self, 'input'):
-					self.input.clear()
+				self.input.clear()
 				return
-			serial_obj = getattr(self, '_serial', None)
+			serial_obj = self._serial
 			if idx == 0 and serial_obj is not None:
 				# Send multiple commands sequentially with proper timing (like TeraTerm)
 				if len(lines) > 1:
@@ -1001,82 +1466,90 @@ class CommConsole(QtWidgets.QWidget):
 					msg = lines[0]
 					serial_obj.write((msg + "\n").encode())
 					# Don't echo the command - only show device response
-				if hasattr(self, 'input'):
-					self.input.clear()
+				self.input.clear()
 			elif idx == 2 and self._adb_connected:
 				# For ADB, send commands one by one (handle multiple commands)
+				process = self._adb_shell_process
+				# Output still waiting for the flush timer goes before the echo
+				self._flush_log()
 				for msg in lines:
-					# Send command to interactive ADB shell using utility function
-					if self._adb_shell_process and is_shell_running(self._adb_shell_process):
-						print(f"[DEBUG] Sending command to ADB shell: {msg}")
-						# Echo the command to the terminal (like a real terminal does)
-						if hasattr(self, 'log'):
-							self.log.appendPlainText(f"$ {msg}")
-						
-						# Send the command using utility function
-						success, message = send_shell_command(self._adb_shell_process, msg)
-						if success:
-							print(f"[DEBUG] Command sent successfully: {message}")
-						else:
-							print(f"[DEBUG] Failed to send command: {message}")
-						
-						# Small delay between commands for ADB
-						if len(lines) > 1:
-							import time
-							time.sleep(0.2)
+					# Echo the command to the terminal (like a real terminal does)
+					self.log.appendPlainText(f"$ {msg}")
+					if process is not None and process.state() == QtCore.QProcess.Running:
+						if _DEBUG:
+							print(f"[DEBUG] Sending command to ADB shell: {msg}")
+						# Buffered by QProcess; the shell reads the lines in order
+						process.write((msg + "\n").encode())
 					else:
-						print("[DEBUG] ADB shell process not running, falling back to single command")
+						if _DEBUG:
+							print("[DEBUG] ADB shell process not running, falling back to single command")
 						# Fallback to single command execution
-						serial = self._adb_serial
-						code, out, err = adb_shell(serial, msg)
-						if hasattr(self, 'log'):
-							self.log.moveCursor(QtGui.QTextCursor.End)
-							self.log.insertPlainText((out + ("\n" if out else "")) or "")
-							if err:
-								self.log.insertPlainText((err + "\n"))
-							self.log.moveCursor(QtGui.QTextCursor.End)
-						# Small delay between commands for ADB
-						if len(lines) > 1:
-							import time
-							time.sleep(0.2)
-				if hasattr(self, 'input'):
-					self.input.clear()
+						code, out, err = adb_shell(self._adb_serial, msg)
+						self._append_log((out + "\n" if out else "") + (err + "\n" if err else ""))
+				self.input.clear()
 		except Exception:
 			# Suppress errors from stray focus or non-UART contexts
 			pass
 
 	def eventFilter(self, source, event):  # type: ignore[override]
 		try:
-			if hasattr(self, 'input') and source is self.input and isinstance(event, QtGui.QKeyEvent):
-				if event.type() == QtCore.QEvent.KeyPress:
-					# Handle Ctrl+C to interrupt running command
-					if event.key() == QtCore.Qt.Key_C and event.modifiers() & QtCore.Qt.ControlModifier:
-						# Only send interrupt if UART protocol is selected and connected
-						idx = self.proto_combo.currentIndex() if hasattr(self, 'proto_combo') else -1
-						if idx == 0 and self._serial is not None:
-							self._on_uart_stop()
-							return True
-					# Handle Enter/Return to send command
-					elif event.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter):
-						if event.modifiers() & QtCore.Qt.ShiftModifier:
-							self.input.insertPlainText("\n")
-						else:
-							self._on_send()
-							return True
+			# Only the input box is filtered; KeyPress events are QKeyEvents
+			if source is self.input and event.type() == QtCore.QEvent.KeyPress:
+				# Handle Ctrl+C to interrupt running command
+				if event.key() == QtCore.Qt.Key_C and event.modifiers() & QtCore.Qt.ControlModifier:
+					# Only send interrupt if UART protocol is selected and connected
+					idx = self.proto_combo.currentIndex()
+					if idx == 0 and self._serial is not None:
+						self._on_uart_stop()
+						return True
+				# Handle Enter/Return to send command
+				elif event.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter):
+					if event.modifiers() & QtCore.Qt.ShiftModifier:
+						self.input.insertPlainText("\n")
+					else:
+						self._on_send()
+						return True
 		except KeyboardInterrupt:
 			return False
 		except Exception:
 			pass
 		return super().eventFilter(source, event)
 
+	def _write_uart_line(self, line: str) -> None:
+		"""Write one line to the open serial port; errors propagate."""
+		serial = self._serial
+		if serial is not None:
+			serial.write((line + "\n").encode())
+
 	def send_line_silent(self, line: str) -> None:
 		"""Send a single line over UART without echoing to the UI/log buffers."""
 		try:
-			if self._serial is not None:
-				self._serial.write((line + "\n").encode())
+			self._write_uart_line(line)
 		except Exception:
 			pass
 
+	def _start_cmd_pump(self, commands: List[str], spacing_ms: int, on_complete: Optional[Callable[[], None]] = None) -> None:
+		# Commands are not echoed - only the device response is shown
+		pump = _CmdPump(self._write_uart_line, commands, spacing_ms, on_complete, self)
+		pump.finished.connect(self._on_cmd_pump_finished)
+		self._cmd_pumps.append(pump)
+		pump.start()
+
+	def _on_cmd_pump_finished(self) -> None:
+		"""Release a finished command pump and run its callback (GUI thread)."""
+		pump = self.sender()
+		if pump not in self._cmd_pumps:
+			return
+		self._cmd_pumps.remove(pump)
+		pump.deleteLater()
+		if pump.on_complete:
+			pump.on_complete()
+
+	def _stop_cmd_pumps(self) -> None:
+		pumps, self._cmd_pumps = self._cmd_pumps, []
+		for pump in pumps:
+			pump.stop()
+
 	def _send_multiple_uart_commands(self, commands: List[str], spacing_ms: int = 200) -> None:
 		"""Send multiple UART commands sequentially with proper timing.
 		
@@ -1089,26 +1562,7 @@ class CommConsole(QtWidgets.QWidget):
 		"""
 		if not commands:
 			return
-		
-		queue = list(commands)
-		timer = QtCore.QTimer(self)
-		timer.setInterval(max(50, int(spacing_ms)))
-		
-		def _send_next():
-			if not queue:
-				timer.stop()
-				return
-			cmd = queue.pop(0)
-			try:
-				if self._serial is not None:
-					self._serial.write((cmd + "\n").encode())
-					# Don't echo command - only show device response
-			except Exception as e:
-				print(f"[DEBUG] Error sending command '{cmd}': {e}")
-		
-		timer.timeout.connect(_send_next)
-		timer.start()
-		_send_next()  # Send first command immediately
+		self._start_cmd_pump(commands, spacing_ms)
 
 	def send_commands_silent(self, commands: List[str], spacing_ms: int = 300, on_complete: Optional[Callable[[], None]] = None) -> None:
 		"""Send commands over UART without echoing them into the console UI."""
@@ -1116,20 +1570,7 @@ class CommConsole(QtWidgets.QWidget):
 			if on_complete:
 				on_complete()
 			return
-		queue = list(commands)
-		timer = QtCore.QTimer(self)
-		timer.setInterval(max(50, int(spacing_ms)))
-		def _flush_next():
-			if not queue:
-				timer.stop()
-				if on_complete:
-					on_complete()
-				return
-			cmd = queue.pop(0)
-			self.send_line_silent(cmd)
-		timer.timeout.connect(_flush_next)
-		timer.start()
-		_flush_next()
+		self._start_cmd_pump(commands, spacing_ms, on_complete)
 
 	def start_capture(self, end_token: str, timeout_ms: int, on_complete: Callable[[str], None]) -> None:
 		"""Begin a UART capture session until end_token is seen or timeout occurs.
@@ -6,11 +6,14 @@ Data collection is handled by external backend systems.
 
 Key Functions:
 - get_timestamp(): Get current Unix timestamp
+- get_monotonic_time(): Get a monotonic clock reading for measuring intervals
 
 Author: Performance GUI Team
 Version: 1.0
 """
 
+import time
+
 
 class Subsystem:
 	"""
@@ -47,7 +50,25 @@ def get_timestamp() -> float:
 		>>> print(f"Current time: {timestamp}")
 		Current time: 1640995200.123
 	"""
-	import time
 	return time.time()
 
+
+def get_monotonic_time() -> float:
+	"""
+	Get a monotonic clock reading in seconds.
+	
+	Unlike get_timestamp(), this clock never jumps when the system time is
+	adjusted (NTP, manual changes), so it is the one to use for deadlines
+	and elapsed-time measurements. Only differences between two readings
+	are meaningful.
+	
+	Returns:
+		float: Monotonic clock value in seconds
+		
+	Example:
+		>>> start = get_monotonic_time()
+		>>> elapsed = get_monotonic_time() - start
+	"""
+	return time.monotonic()
+
 # CPU data collection functions removed - using external backend
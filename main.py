@@ -25,19 +25,22 @@ from __future__ import annotations
 
 # Standard library imports
 import csv
+import functools
+import math
 import os
 import re
 import sys
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 # GUI framework imports
 from PySide6 import QtCore, QtGui, QtWidgets
+import numpy as np
 import pyqtgraph as pg
 
 # Local module imports
-from data_sources import Subsystem, get_timestamp
+from data_sources import Subsystem, get_monotonic_time, get_timestamp
 from adb_utils import (
 	is_adb_available as _adb_available,
 	list_devices as _adb_list_devices,
@@ -88,8 +91,6 @@ class TimeAxis(pg.AxisItem):
 			during initial layout calculations.
 		"""
 		# Be defensive: PyQtGraph may call with None/0 values during layout
-		labels: List[str] = []
-		
 		# Safely extract scale and spacing values with fallbacks
 		try:
 			sc = float(scale) if isinstance(scale, (int, float)) else 1.0
@@ -98,32 +99,56 @@ class TimeAxis(pg.AxisItem):
 			sc = 1.0
 			sps = 1.0
 			
-		# Process each tick value
-		for v in values:
-			try:
-				sec = float(v) * sc  # Convert to actual seconds
-			except Exception:
-				sec = 0.0
+		# Real-time redraws keep asking for the same tick positions, so the
+		# labels are formatted once per distinct set and then reused
+		return list(_format_time_ticks(tuple(values), sc, sps < 1))
+
+
+# Zero-padded "00".."59" for minute/second label fields
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+
+@functools.lru_cache(maxsize=256)
+def _format_time_ticks(values: Tuple[float, ...], sc: float, fine: bool) -> Tuple[str, ...]:
+	"""
+	Format tick positions as time labels (see TimeAxis.tickStrings).
+	
+	Args:
+		values: Tick positions on the axis
+		sc: Scale factor converting positions to seconds
+		fine: Show one decimal for sub-minute labels (tick spacing below 1)
+		
+	Returns:
+		Tuple[str, ...]: One label per tick position
+	"""
+	labels: List[str] = []
+	# Process each tick value
+	for v in values:
+		try:
+			sec = float(v) * sc  # Convert to actual seconds
+		except Exception:
+			sec = 0.0
+			
+		# Format based on time duration; one integer divmod chain serves
+		# both the minute and the hour format
+		if sec >= 60:
+			minutes, seconds = divmod(int(sec), 60)
+			if minutes >= 60:  # 1 hour or more
+				hours, minutes = divmod(minutes, 60)
+				labels.append(f"{hours}h{_TWO_DIGITS[minutes]}m")
+			else:  # 1 minute to 1 hour
+				labels.append(f"{minutes}:{_TWO_DIGITS[seconds]}")
+		else:  # Less than 1 minute
+			# Show 1 decimal when spacing is small for better precision
+			if fine:
+				labels.append(f"{sec:.1f}s")
+			else:
+				labels.append(f"{int(sec)}s")
 				
-			# Format based on time duration
-			if sec >= 3600:  # 1 hour or more
-				hours = int(sec // 3600)
-				minutes = int((sec % 3600) // 60)
-				labels.append(f"{hours}h{minutes:02d}m")
-			elif sec >= 60:  # 1 minute to 1 hour
-				minutes = int(sec // 60)
-				seconds = int(sec % 60)
-				labels.append(f"{minutes}:{seconds:02d}")
-			else:  # Less than 1 minute
-				# Show 1 decimal when spacing is small for better precision
-				if sps < 1:
-					labels.append(f"{sec:.1f}s")
-				else:
-					labels.append(f"{int(sec)}s")
-					
-		return labels
+	return tuple(labels)
 
 
+@functools.lru_cache(maxsize=128)
 def _nice_tick_seconds(raw_step: float) -> float:
 	"""
 	Calculate a 'nice' tick step value close to the raw step size.
@@ -152,7 +177,6 @@ def _nice_tick_seconds(raw_step: float) -> float:
 	if raw_step <= 0:
 		return 1.0
 		
-	import math
 	# Find the order of magnitude (power of 10)
 	exp = math.floor(math.log10(raw_step))
 	# Normalize to 1-10 range
@@ -176,6 +200,86 @@ def _nice_tick_seconds(raw_step: float) -> float:
 SUBSYSTEMS = [Subsystem.CPU, Subsystem.GPU, Subsystem.DRAM]
 
 
+# Initial per-column capacity of a SampleBuffer; it doubles when full
+_SAMPLE_BUFFER_CAPACITY = 1024
+
+# Stress output block lines, compiled once for the per-line tail parser
+_BLOCK_CPU_RE = re.compile(r"^\s*cpu:\s*([0-9]+(?:\.[0-9]+)?)%")
+_BLOCK_CORE_RE = re.compile(r"^\s*cpu(\d+):\s*([0-9]+(?:\.[0-9]+)?)%")
+_BLOCK_DRAM_RE = re.compile(r"^\[Monitor\]\s*DRAM\s*usage:\s*([0-9]+(?:\.[0-9]+)?)%")
+_BLOCK_GPU_RE = re.compile(r"^\[Monitor\]\s*GPU\s*usage:\s*([0-9]+(?:\.[0-9]+)?)%")
+
+# Block playback backlog bound: past the max, the oldest blocks are dropped
+# down to the trim level so the plot stays near live instead of catching up
+_MAX_BACKLOG_BLOCKS = 16
+_BACKLOG_TRIM_BLOCKS = 8
+
+# Delay before the command preview is rebuilt after a slider/field change
+_CMD_PREVIEW_DELAY_MS = 50
+
+# Stress file tail poll intervals: fast while the file has no kernel watch
+# (not created yet, or dropped after rotation), slow safety net otherwise
+_TAIL_POLL_MS = 500
+_TAIL_WATCHED_POLL_MS = 5000
+
+
+class SampleBuffer:
+	"""
+	Growable struct-of-arrays store for (timestamp, value) samples.
+	
+	Timestamps and values live in two preallocated float64 NumPy arrays
+	instead of a list of tuples, so a sample costs 16 bytes and plotting can
+	hand contiguous array views to pyqtgraph without walking Python objects.
+	The full history is kept (capacity doubles when full) because CSV export
+	needs every sample of the run.
+	
+	Indexing and iteration yield (timestamp, value) tuples, so read-only
+	callers written against the former list of tuples keep working.
+	"""
+	
+	__slots__ = ("_ts", "_val", "_count")
+	
+	def __init__(self, capacity: int = _SAMPLE_BUFFER_CAPACITY) -> None:
+		self._ts = np.empty(capacity, dtype=np.float64)
+		self._val = np.empty(capacity, dtype=np.float64)
+		self._count = 0
+	
+	def append(self, ts: float, val: float) -> None:
+		"""Store one sample, growing both columns when they are full."""
+		n = self._count
+		if n == self._ts.shape[0]:
+			# Fresh arrays rather than an in-place resize: views handed out
+			# by xy() stay valid
+			self._ts = np.concatenate((self._ts, np.empty(n, dtype=np.float64)))
+			self._val = np.concatenate((self._val, np.empty(n, dtype=np.float64)))
+		self._ts[n] = ts
+		self._val[n] = val
+		self._count = n + 1
+	
+	def clear(self) -> None:
+		"""Drop all samples; the allocated capacity is reused."""
+		self._count = 0
+	
+	def xy(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""Return (timestamps, values) as views over the stored samples."""
+		n = self._count
+		return self._ts[:n], self._val[:n]
+	
+	def __len__(self) -> int:
+		return self._count
+	
+	def __getitem__(self, index: int) -> Tuple[float, float]:
+		if index < 0:
+			index += self._count
+		if not 0 <= index < self._count:
+			raise IndexError("sample index out of range")
+		return float(self._ts[index]), float(self._val[index])
+	
+	def __iter__(self):
+		n = self._count
+		return zip(self._ts[:n].tolist(), self._val[:n].tolist())
+
+
 @dataclass
 class SubsystemState:
 	"""
@@ -189,18 +293,18 @@ class SubsystemState:
 	Attributes:
 		name (str): The name of the subsystem (e.g., "CPU", "GPU", "DRAM")
 		target_percent (int): The target performance percentage (0-100)
-		values (List[Tuple[float, float]]): List of (timestamp, value) pairs
+		values (SampleBuffer): Recorded (timestamp, value) samples
 		curve (Optional[pg.PlotDataItem]): PyQtGraph curve object for plotting
 		target_line (Optional[pg.InfiniteLine]): PyQtGraph line for target indicator
 		
 	Note:
-		The values list stores tuples of (timestamp, percentage) where:
+		The values buffer stores (timestamp, percentage) samples where:
 		- timestamp is Unix epoch time in seconds
 		- percentage is the subsystem utilization (0.0-100.0)
 	"""
 	name: str
 	target_percent: int = 50
-	values: List[Tuple[float, float]] = field(default_factory=list)
+	values: SampleBuffer = field(default_factory=SampleBuffer)
 	curve: Optional[pg.PlotDataItem] = None
 	target_line: Optional[pg.InfiniteLine] = None
 
@@ -217,22 +321,147 @@ class CoreState:
 	Attributes:
 		core_id (int): The CPU core identifier (0-based index)
 		target_percent (int): The target performance percentage for this core (0-100)
-		values (List[Tuple[float, float]]): List of (timestamp, value) pairs
+		values (SampleBuffer): Recorded (timestamp, value) samples
 		curve (Optional[pg.PlotDataItem]): PyQtGraph curve object for plotting
 		target_line (Optional[pg.InfiniteLine]): PyQtGraph line for target indicator
 		
 	Note:
-		The values list stores tuples of (timestamp, percentage) where:
+		The values buffer stores (timestamp, percentage) samples where:
 		- timestamp is Unix epoch time in seconds
 		- percentage is the core utilization (0.0-100.0)
 	"""
 	core_id: int
 	target_percent: int = 50
-	values: List[Tuple[float, float]] = field(default_factory=list)
+	values: SampleBuffer = field(default_factory=SampleBuffer)
 	curve: Optional[pg.PlotDataItem] = None
 	target_line: Optional[pg.InfiniteLine] = None
 
 
+# nproc reply: wait at most this long, reading in slices of this length
+_NPROC_REPLY_TIMEOUT_S = 1.0
+_NPROC_READ_SLICE_S = 0.05
+# A reply line that is purely a number
+_NPROC_LINE_RE = re.compile(rb"\s*\d+\s*")
+
+
+def _query_nproc_over_uart(port: str) -> Optional[int]:
+	"""Ask Linux for its core count with ``nproc`` over the UART at port.
+
+	Blocking (opens the port, waits for the reply); run it off the GUI thread.
+	Returns None if the port fails or no plausible count (1-10) comes back.
+	"""
+	import serial
+	
+	ser = None
+	try:
+		ser = serial.Serial(port=port, baudrate=921600, timeout=3, write_timeout=2)
+		print(f"[DEBUG] Connected to {port}, sending nproc command...")
+		
+		# Clear any pending bytes to avoid mixing old output
+		try:
+			ser.reset_input_buffer()
+		except Exception:
+			pass
+		# Send nproc command
+		ser.write(b"nproc\n")
+		ser.flush()  # Ensure command is sent
+		
+		# Read in short slices until a complete reply line shows up, rather
+		# than always sleeping out the whole reply window
+		ser.timeout = _NPROC_READ_SLICE_S
+		deadline = get_monotonic_time() + _NPROC_REPLY_TIMEOUT_S
+		buf = bytearray()
+		checked = 0
+		while get_monotonic_time() < deadline:
+			chunk = ser.read(64)
+			if not chunk:
+				continue
+			buf += chunk
+			# Look for a line that is purely a number (avoid timestamps/prompts);
+			# only newline-terminated lines, so "1" of a late "10" is not taken
+			end = buf.rfind(b"\n")
+			if end < checked:
+				continue
+			for line in bytes(buf[checked:end]).split(b"\n"):
+				if _NPROC_LINE_RE.fullmatch(line):
+					val_candidate = int(line)
+					# Cap core count to a maximum of 6 as requested
+					if 1 <= val_candidate <= 10:
+						print(f"[DEBUG] nproc response: {bytes(buf)!r}")
+						return val_candidate
+			checked = end + 1
+		print(f"[DEBUG] No number found in nproc response: {bytes(buf)!r}")
+	except Exception as e:
+		print(f"[DEBUG] UART communication error: {e}")
+	finally:
+		try:
+			if ser is not None:
+				ser.close()
+				print(f"[DEBUG] Closed UART connection to {port}")
+		except Exception as e:
+			print(f"[DEBUG] Error closing UART: {e}")
+	return None
+
+
+class _NprocProbeSignals(QtCore.QObject):
+	"""Signal carrier for _NprocProbeWorker (QRunnable is not a QObject)."""
+
+	# Core count reported by nproc, or None if the probe failed
+	probed = QtCore.Signal(object)
+
+
+class _NprocProbeWorker(QtCore.QRunnable):
+	"""Runs _query_nproc_over_uart on a QThreadPool thread and reports the result."""
+
+	def __init__(self, signals: _NprocProbeSignals, port: str) -> None:
+		super().__init__()
+		self._signals = signals
+		self._port = port
+
+	def run(self) -> None:
+		try:
+			val = _query_nproc_over_uart(self._port)
+		except Exception as e:
+			print(f"[DEBUG] Core count detection failed: {e}")
+			val = None
+		self._signals.probed.emit(val)
+
+
+class _TailReadSignals(QtCore.QObject):
+	"""Signal carrier for _TailReadWorker (QRunnable is not a QObject)."""
+
+	# (generation, new position, file size, appended bytes or None on error)
+	read = QtCore.Signal(object)
+
+
+class _TailReadWorker(QtCore.QRunnable):
+	"""Reads what was appended to the stress file since pos on a QThreadPool thread."""
+
+	def __init__(self, signals: _TailReadSignals, generation: int, path: str, pos: int) -> None:
+		super().__init__()
+		self._signals = signals
+		self._generation = generation
+		self._path = path
+		self._pos = pos
+
+	def run(self) -> None:
+		pos = self._pos
+		size = 0
+		data: Optional[bytes] = None
+		try:
+			# Handle truncation/rotation: if file shrank, restart at 0
+			size = os.path.getsize(self._path)
+			if size < pos:
+				pos = 0
+			with open(self._path, 'rb') as f:
+				f.seek(pos)
+				data = f.read()
+			pos += len(data)
+		except Exception:
+			data = None
+		self._signals.read.emit((self._generation, pos, size, data))
+
+
 class PerformanceApp(QtWidgets.QMainWindow):
 	"""
 	Main application class for the Performance Dashboard.
@@ -311,6 +540,22 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		self.process: Optional[QtCore.QProcess] = None
 		self.line_buffer: bytes = b""
 
+		# Coalesces command preview rebuilds while sliders are being dragged
+		self._cmd_preview_timer = QtCore.QTimer(self)
+		self._cmd_preview_timer.setSingleShot(True)
+		self._cmd_preview_timer.setInterval(_CMD_PREVIEW_DELAY_MS)
+		self._cmd_preview_timer.timeout.connect(self._update_command_preview)
+
+		# Linux core-count probe runs on the thread pool (it holds the UART for
+		# about a second); _nproc_on_done continues the Load Binary flow
+		self._nproc_signals = _NprocProbeSignals(self)
+		self._nproc_signals.probed.connect(self._on_linux_core_count)
+		self._nproc_on_done: Optional[Callable[[], None]] = None
+		# Linux UART port found for the last probe, reused by the next step
+		self._nproc_port: Optional[str] = None
+		# Set while the console's reader is paused so the probe gets the reply
+		self._nproc_paused_console = False
+
 		# Initialize CPU cores (detects actual core count)
 		self._init_cpu_cores()
 		
@@ -339,20 +584,34 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		# File tail reader for stress tool output monitoring
 		# Monitors external stress tool output files for real-time data
 		self._file_tail_timer = QtCore.QTimer(self)
-		self._file_tail_timer.setInterval(500)
-		self._file_tail_timer.timeout.connect(self._read_stress_file_tail)
+		self._file_tail_timer.setInterval(_TAIL_POLL_MS)
+		self._file_tail_timer.timeout.connect(lambda: self._read_stress_file_tail(polled=True))
 		self._file_tail_path: Optional[str] = None
 		self._file_tail_pos: int = 0
 		self._file_tail_rem: bytes = b""
+		# Partial trailing line of the adb tail process stdout
+		self._proc_line_rem: bytes = b""
 		self._file_block_idx: int = -1
 		self._file_start_epoch: float = 0.0
 		self._file_watcher = QtCore.QFileSystemWatcher(self)
 		self._file_watcher.fileChanged.connect(lambda _p: self._read_stress_file_tail())
+		# Disk reads run on the thread pool, one at a time; a wakeup during a
+		# read is folded into one follow-up read. Results from before the last
+		# start/stop/clear carry an old generation and are dropped
+		self._tail_read_signals = _TailReadSignals(self)
+		self._tail_read_signals.read.connect(self._on_tail_read)
+		self._tail_generation: int = 0
+		self._tail_reading: bool = False
+		self._tail_read_again: bool = False
+		self._tail_read_polled: bool = False
+		# Set once a safety-net poll finds data the watcher did not report
+		self._tail_watch_missed: bool = False
 		
 		# Block playback queue and scheduler (emit blocks every 250ms)
 		# Used for processing stress tool output in blocks
 		self._block_queue: List[Tuple[Optional[float], Dict[int, float], Optional[float], Optional[float]]] = []
 		self._next_block_due_epoch: Optional[float] = None
+		self._dropped_blocks: int = 0
 		self._block_timer = QtCore.QTimer(self)
 		self._block_timer.setInterval(250)
 		self._block_timer.timeout.connect(self._maybe_emit_block)
@@ -572,15 +831,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		cpu_target_text.setFixedWidth(40)
 		cpu_target_text.setAlignment(QtCore.Qt.AlignCenter)
 		cpu_target_slider.valueChanged.connect(lambda val, field=cpu_target_text: field.setText(str(int(val))))
-		def _apply_cpu_target_txt():
-			try:
-				val_int = int(cpu_target_text.text() or 0)
-				val_int = max(0, min(100, val_int))
-				if cpu_target_slider.value() != val_int:
-					cpu_target_slider.setValue(val_int)
-			except Exception:
-				pass
-		cpu_target_text.editingFinished.connect(_apply_cpu_target_txt)
+		cpu_target_text.editingFinished.connect(functools.partial(self._sync_slider_from_text, cpu_target_slider, cpu_target_text))
 		cpu_target_row.addWidget(cpu_target_text)
 		self.cpu_target_text = cpu_target_text
 		
@@ -620,17 +871,8 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			txt.setFixedWidth(40)
 			txt.setAlignment(QtCore.Qt.AlignCenter)
 			slider.valueChanged.connect(lambda val, field=txt: field.setText(str(int(val))))
-			def _apply_txt(cid=core_id, field_ref=None):
-				# On edit, push to slider and target
-				try:
-					val_int = int((field_ref or txt).text() or 0)
-					val_int = max(0, min(100, val_int))
-					sel_slider = self.core_sliders[cid]
-					if sel_slider.value() != val_int:
-						sel_slider.setValue(val_int)
-				except Exception:
-					pass
-			txt.editingFinished.connect(lambda cid=core_id, field_ref=txt: _apply_txt(cid, field_ref))
+			# On edit, push to slider and target
+			txt.editingFinished.connect(functools.partial(self._sync_slider_from_text, slider, txt))
 			core_row.addWidget(txt)
 			self.core_texts[core_id] = txt
 			
@@ -687,10 +929,10 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		slider_row.addWidget(self.duration_text)
 		user_v.addLayout(slider_row)
 		# Wiring: keep all three in sync
-		self.duration_slider.valueChanged.connect(lambda v: (self.duration_spin.setValue(int(v)), self._update_command_preview()))
-		self.duration_spin.valueChanged.connect(lambda v: (self.duration_text.setText(str(int(v))), self._update_command_preview()))
+		self.duration_slider.valueChanged.connect(lambda v: (self.duration_spin.setValue(int(v)), self._cmd_preview_timer.start()))
+		self.duration_spin.valueChanged.connect(lambda v: (self.duration_text.setText(str(int(v))), self._cmd_preview_timer.start()))
 		self.duration_spin.valueChanged.connect(lambda v: (self.duration_slider.setValue(int(v)) if 1 <= int(v) <= 3600 else None))
-		self.duration_text.editingFinished.connect(lambda: (self.duration_spin.setValue(int(self.duration_text.text() or 60)), self._update_command_preview()))
+		self.duration_text.editingFinished.connect(lambda: (self.duration_spin.setValue(int(self.duration_text.text() or 60)), self._cmd_preview_timer.start()))
 		# Generated command preview (for Linux stress tool)
 		user_v.addWidget(self._make_label("Generated command (auto-updates):", bold=True))
 		cmd_row = QtWidgets.QHBoxLayout()
@@ -828,8 +1070,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		
 		# Enable smooth scrolling and better performance
 		self.plot_widget.setClipToView(True)
-		self.plot_widget.setDownsampling(mode='peak')
-		self.plot_widget.setDownsampling(auto=True)
+		self.plot_widget.setDownsampling(auto=True, mode='peak')
 		
 		# Better performance for real-time updates
 		self.plot_widget.setCacheMode(QtWidgets.QGraphicsView.CacheBackground)
@@ -1047,17 +1288,26 @@ class PerformanceApp(QtWidgets.QMainWindow):
 				return
 			
 			print("[DEBUG] Using UART workflow for Yocto/Ubuntu")
-			# Refresh core count dynamically by querying Linux via hidden UART
+			# Refresh core count dynamically by querying Linux via hidden UART;
+			# the remaining steps run once the probe reports back
 			print("[DEBUG] Step 1: Updating core count from Linux")
-			self._update_core_count_from_linux()
-			
+			self._update_core_count_from_linux(on_done=self._finish_linux_load_binary)
+		except Exception as e:
+			print(f"[DEBUG] Load binary error: {e}")
+			import traceback
+			traceback.print_exc()
+
+	def _finish_linux_load_binary(self) -> None:
+		"""Steps of the Yocto/Ubuntu Load Binary flow after the core count probe."""
+		try:
 			# Rebuild core UI and active-graph list
 			print("[DEBUG] Step 2: Rebuilding core UI")
 			self._rebuild_core_ui()
 			print("[DEBUG] Step 3: Rebuilding active combo")
 			self._rebuild_active_combo()
 			print("[DEBUG] Step 4: Auto loading binary over UART")
-			self._auto_load_binary_over_uart()
+			# Same port the probe just used; no second port enumeration
+			self._auto_load_binary_over_uart(self._nproc_port)
 		except Exception as e:
 			print(f"[DEBUG] Load binary error: {e}")
 			import traceback
@@ -1128,92 +1378,60 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		except Exception:
 			pass
 
-	def _update_core_count_from_linux(self) -> None:
+	def _update_core_count_from_linux(self, on_done: Optional[Callable[[], None]] = None) -> None:
 		"""Query Linux over UART for number of cores using nproc and update UI state.
 
+		The serial exchange runs on the thread pool so the UI keeps painting;
+		the result is applied in _on_linux_core_count, which then calls on_done.
 		Falls back to existing core_count on failure.
 		"""
+		if self._nproc_on_done is not None:
+			print("[DEBUG] Core count probe already running")
+			return
 		try:
-			from serial.tools import list_ports
-			import serial
-			import re
-			
+			# Same lookup as the console's (cached port list, lowest COM number)
 			needle = "VID:PID=067B:23A3"
-			candidates = []
-			for p in list_ports.comports():
-				if needle in (getattr(p, 'hwid', '') or ''):
-					candidates.append(p.device)
-			
-			if not candidates:
-				print(f"[DEBUG] No UART ports found with VID:PID={needle}")
-				return
-			
-			def _com_num(name: str) -> int:
-				m = re.search(r"COM(\d+)$", name.upper())
-				return int(m.group(1)) if m else 1_000_000
-			candidates.sort(key=_com_num)
-			port = candidates[0]
-			print(f"[DEBUG] Using UART port: {port}")
-			
-			ser = None
-			try:
-				ser = serial.Serial(port=port, baudrate=921600, timeout=3, write_timeout=2)
-				print(f"[DEBUG] Connected to {port}, sending nproc command...")
-				
-				# Clear any pending bytes to avoid mixing old output
-				try:
-					ser.reset_input_buffer()
-				except Exception:
-					pass
-				# Send nproc command
-				ser.write(b"nproc\n")
-				ser.flush()  # Ensure command is sent
-				
-				# Wait a bit longer and read more data
-				time.sleep(1.0)
-				resp = ser.read(256).decode(errors='ignore')
-				print(f"[DEBUG] nproc response: {repr(resp)}")
-				
-				# Look for a line that is purely a number (avoid timestamps/prompts)
-				val: Optional[int] = None
-				for line in resp.splitlines():
-					if re.fullmatch(r"\s*\d+\s*", line or ""):
-						try:
-							val_candidate = int(line.strip())
-							# Cap core count to a maximum of 6 as requested
-							if 1 <= val_candidate <= 10:
-								val = val_candidate
-								break
-						except Exception:
-							pass
-				if val is not None:
-					old_count = getattr(self, 'core_count_linux', 7)
-					if val != old_count:
-						self.core_count_linux = val
-						print(f"[DEBUG] Updated Linux core count from {old_count} to {val}")
-						# Update current core_count if Linux OS is selected
-						os_sel = getattr(self, 'selected_target_os', None) or (self.combo_target_os.currentText() if hasattr(self, 'combo_target_os') else "")
-						if os_sel in ("Yocto", "Ubuntu"):
-							self.core_count = val
-							# Rebuild core states for the new count
-							self.core_states = {i: CoreState(core_id=i) for i in range(self.core_count)}
-							print(f"[DEBUG] Updated current core_count to {val} (Linux selected)")
-					else:
-						print(f"[DEBUG] Linux core count already set to {val}")
-				else:
-					print(f"[DEBUG] No number found in nproc response: {resp}")
-					
-			except Exception as e:
-				print(f"[DEBUG] UART communication error: {e}")
-			finally:
-				try:
-					if ser is not None:
-						ser.close()
-						print(f"[DEBUG] Closed UART connection to {port}")
-				except Exception as e:
-					print(f"[DEBUG] Error closing UART: {e}")
+			port = self.comm_console.find_linux_port(needle)
 		except Exception as e:
 			print(f"[DEBUG] Core count detection failed: {e}")
+			port = None
+		self._nproc_on_done = on_done or (lambda: None)
+		self._nproc_port = port
+		if not port:
+			print(f"[DEBUG] No UART ports found with VID:PID={needle}")
+			self._on_linux_core_count(None)
+			return
+		print(f"[DEBUG] Using UART port: {port}")
+		# A console still connected to this port would read the nproc reply
+		# before the probe does (the GUI thread is live during the probe)
+		try:
+			self._nproc_paused_console = self.comm_console.pause_uart_reading(port)
+		except Exception:
+			self._nproc_paused_console = False
+		QtCore.QThreadPool.globalInstance().start(_NprocProbeWorker(self._nproc_signals, port))
+
+	def _on_linux_core_count(self, val: Optional[int]) -> None:
+		"""Apply a probed Linux core count, then continue the waiting flow."""
+		on_done, self._nproc_on_done = self._nproc_on_done, None
+		if self._nproc_paused_console:
+			self._nproc_paused_console = False
+			self.comm_console.resume_uart_reading()
+		if val is not None:
+			old_count = getattr(self, 'core_count_linux', 7)
+			if val != old_count:
+				self.core_count_linux = val
+				print(f"[DEBUG] Updated Linux core count from {old_count} to {val}")
+				# Update current core_count if Linux OS is selected
+				os_sel = getattr(self, 'selected_target_os', None) or (self.combo_target_os.currentText() if hasattr(self, 'combo_target_os') else "")
+				if os_sel in ("Yocto", "Ubuntu"):
+					self.core_count = val
+					# Rebuild core states for the new count
+					self.core_states = {i: CoreState(core_id=i) for i in range(self.core_count)}
+					print(f"[DEBUG] Updated current core_count to {val} (Linux selected)")
+			else:
+				print(f"[DEBUG] Linux core count already set to {val}")
+		if on_done is not None:
+			on_done()
 
 	def _update_core_count_from_aaos(self) -> None:
 		"""Query AAOS device via ADB for number of cores using /proc/cpuinfo and update UI state.
@@ -1323,6 +1541,19 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		core_count = getattr(self, 'core_count', 0)
 		print(f"[DEBUG] Rebuilding core UI with {core_count} cores")
 		
+		# Suspend painting of the cores panel while rows are torn down and
+		# recreated, so the churn lands as one repaint when updates resume
+		container = self.cores_layout.parentWidget()
+		if container is not None:
+			container.setUpdatesEnabled(False)
+		try:
+			self._populate_core_ui()
+		finally:
+			if container is not None:
+				container.setUpdatesEnabled(True)
+
+	def _populate_core_ui(self) -> None:
+		"""Clear cores_layout and create the header, CPU Target and per-core rows."""
 		# Remove all existing items (widgets and sub-layouts) to avoid duplicates
 		self._clear_layout(self.cores_layout)
 		# Reset data structures
@@ -1359,7 +1590,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		cpu_target_text.setFixedWidth(40)
 		cpu_target_text.setAlignment(QtCore.Qt.AlignCenter)
 		cpu_target_slider.valueChanged.connect(lambda val, field=cpu_target_text: field.setText(str(int(val))))
-		cpu_target_text.editingFinished.connect(lambda: self._on_cpu_target_changed(int(cpu_target_text.text() or 0)))
+		cpu_target_text.editingFinished.connect(functools.partial(self._sync_slider_from_text, cpu_target_slider, cpu_target_text))
 		cpu_target_row.addWidget(cpu_target_text)
 		self.cpu_target_text = cpu_target_text
 		cpu_target_row.addStretch(1)
@@ -1390,7 +1621,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			txt.setFixedWidth(40)
 			txt.setAlignment(QtCore.Qt.AlignCenter)
 			slider.valueChanged.connect(lambda val, field=txt: field.setText(str(int(val))))
-			txt.editingFinished.connect(lambda cid=core_id, field_ref=txt: self._on_core_target_changed(cid, int(field_ref.text() or 0)))
+			txt.editingFinished.connect(functools.partial(self._sync_slider_from_text, slider, txt))
 			core_row.addWidget(txt)
 			self.core_texts[core_id] = txt
 			core_row.addStretch(1)
@@ -1413,14 +1644,17 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		except Exception:
 			pass
 
-	def _auto_load_binary_over_uart(self) -> None:
-		"""Find Linux UART by VID:PID, open the console, and send commands visibly."""
+	def _auto_load_binary_over_uart(self, linux_port: Optional[str] = None) -> None:
+		"""Find Linux UART by VID:PID, open the console, and send commands visibly.
+
+		A port already located by the caller is used as is.
+		"""
 		# Locate the Linux UART using the same VID:PID logic as elsewhere
-		linux_port = None
-		try:
-			linux_port = self.comm_console.find_linux_port("VID:PID=067B:23A3")
-		except Exception:
-			linux_port = None
+		if not linux_port:
+			try:
+				linux_port = self.comm_console.find_linux_port("VID:PID=067B:23A3")
+			except Exception:
+				linux_port = None
 		if not linux_port:
 			self._show_error_dialog("Linux UART Not Found", "Couldn't locate a COM port with VID:PID=067B:23A3.")
 			return
@@ -1751,35 +1985,24 @@ class PerformanceApp(QtWidgets.QMainWindow):
 
 	def _on_reset_graph(self) -> None:
 		"""Reset graph zoom and pan to show full data range."""
-		# Get all data points to determine the range
-		all_x_values = []
-		all_y_values = []
-		
-		# Collect data from all subsystems
-		for state in self.states.values():
-			if state.values:
-				for ts, val in state.values:
-					all_x_values.append(ts)
-					all_y_values.append(val)
-		
-		# Collect data from all CPU cores
-		for core_state in self.core_states.values():
-			if core_state.values:
-				for ts, val in core_state.values:
-					all_x_values.append(ts)
-					all_y_values.append(val)
+		# Get the sample columns of every subsystem and CPU core with data
+		columns = [
+			state.values.xy()
+			for state in (*self.states.values(), *self.core_states.values())
+			if state.values
+		]
 		
-		if not all_x_values:
+		if not columns:
 			# No data yet, reset to default view
 			self.plot_widget.setXRange(0, 60)
 			self.plot_widget.setYRange(0, 100)
 			return
 		
 		# Calculate data range
-		min_x = min(all_x_values)
-		max_x = max(all_x_values)
-		min_y = min(all_y_values)
-		max_y = max(all_y_values)
+		min_x = min(float(ts.min()) for ts, _ in columns)
+		max_x = max(float(ts.max()) for ts, _ in columns)
+		min_y = min(float(vals.min()) for _, vals in columns)
+		max_y = max(float(vals.max()) for _, vals in columns)
 		
 		# Convert to relative time (seconds from start)
 		if min_x > 0:
@@ -1926,15 +2149,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			txt.setValidator(QtGui.QIntValidator(0, 100, self))
 			txt.setFixedWidth(40)
 			slider.valueChanged.connect(lambda val, field=txt: field.setText(str(int(val))))
-			def _apply_txt_sys(sys_name=name, field_ref=None):
-				try:
-					val_int = int((field_ref or txt).text() or 0)
-					val_int = max(0, min(100, val_int))
-					if slider.value() != val_int:
-						slider.setValue(val_int)
-				except Exception:
-					pass
-			txt.editingFinished.connect(lambda sys_name=name, field_ref=txt: _apply_txt_sys(sys_name, field_ref))
+			txt.editingFinished.connect(functools.partial(self._sync_slider_from_text, slider, txt))
 			row_layout.addWidget(txt)
 			self.slider_form.addRow(QtWidgets.QLabel(f"{name} Target:"), row_widget)
 
@@ -1967,7 +2182,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		if self.combo_active.currentText() == name and self.states[name].target_line is not None:
 			self.states[name].target_line.setValue(value)
 		self._update_numeric_colors()
-		self._update_command_preview()
+		self._cmd_preview_timer.start()
 
 	def _on_cpu_target_changed(self, value: int) -> None:
 		"""Handle CPU target slider changes."""
@@ -1988,7 +2203,16 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		if self.combo_active.currentText() == Subsystem.CPU and self.states[Subsystem.CPU].target_line is not None:
 			self.states[Subsystem.CPU].target_line.setValue(value)
 		self._update_numeric_colors()
-		self._update_command_preview()
+		self._cmd_preview_timer.start()
+
+	def _sync_slider_from_text(self, slider: QtWidgets.QSlider, text: QtWidgets.QLineEdit) -> None:
+		"""Push an edited target percentage to its slider; the slider's handler does the rest."""
+		try:
+			val_int = max(0, min(100, int(text.text() or 0)))
+		except ValueError:
+			return
+		if slider.value() != val_int:
+			slider.setValue(val_int)
 
 	def _on_core_target_changed(self, core_id: int, value: int) -> None:
 		self.core_states[core_id].target_percent = int(value)
@@ -1996,7 +2220,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		if (active == "CPU (cores)" or active == f"Core {core_id}") and self.core_states[core_id].target_line is not None:
 			self.core_states[core_id].target_line.setValue(value)
 		self._update_numeric_colors()
-		self._update_command_preview()
+		self._cmd_preview_timer.start()
 
 	def _refresh_plot_items(self) -> None:
 		self.plot_widget.clear()
@@ -2008,10 +2232,11 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			# Plot all CPU cores with distinct colors and own target lines
 			for core_id in range(getattr(self, 'core_count', 0)):
 				state = self.core_states[core_id]
-				state.curve = self.plot_widget.plot([], [], pen=self._get_core_pen(core_id))
+				pen = self._get_core_pen(core_id)
+				state.curve = self.plot_widget.plot([], [], pen=pen)
 				# Only show target line if this core is active (has target set)
 				if core_id in self.active_cores:
-					line = pg.InfiniteLine(angle=0, movable=False, pen=pg.mkPen(color=self._get_core_pen(core_id).color(), width=1, style=QtCore.Qt.DotLine))
+					line = pg.InfiniteLine(angle=0, movable=False, pen=pg.mkPen(color=pen.color(), width=1, style=QtCore.Qt.DotLine))
 					line.setValue(state.target_percent)
 					self.plot_widget.addItem(line)
 					state.target_line = line
@@ -2054,7 +2279,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		self.os_running_states[os_sel] = True
 		self.is_running = True
 		duration_s = int(self.duration_spin.value())
-		self.end_time_epoch = get_timestamp() + duration_s
+		self.end_time_epoch = get_monotonic_time() + duration_s
 		# Ensure command preview reflects current selections and reset live log buffer
 		self._update_command_preview()
 		self._raw_log_buffer = ""
@@ -2062,6 +2287,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		self._file_tail_path = None
 		self._file_tail_pos = 0
 		self._file_tail_rem = b""
+		self._tail_generation += 1
 		cmd_line = self.command_preview.toPlainText().strip()
 		# If AAOS binary, execute via ADB instead of UART
 		if cmd_line.startswith("./android_stress_tool"):
@@ -2242,6 +2468,10 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		"""Start streaming the device log file into the app via adb tail -f."""
 		try:
 			self._stop_process()
+			# Blocks are parsed straight from the process stdout, no file polling
+			self._proc_line_rem = b""
+			self._file_start_epoch = get_timestamp()
+			self._reset_block_parse()
 			self.process = QtCore.QProcess(self)
 			self.process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
 			self.process.readyReadStandardOutput.connect(self._on_process_output)
@@ -2424,7 +2654,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		self._update_button_states_for_os(os_sel)
 
 	def _on_process_output(self) -> None:
-		now = get_timestamp()
+		now = get_monotonic_time()
 		if self.is_running and self.end_time_epoch is not None and now >= self.end_time_epoch:
 			self._on_stop()
 			return
@@ -2435,10 +2665,13 @@ class PerformanceApp(QtWidgets.QMainWindow):
 					self._raw_log_buffer += chunk.decode(errors='ignore')
 				except Exception:
 					self._raw_log_buffer += str(chunk)
+				# Split into lines keeping remainder, then queue parsed blocks
+				lines = (self._proc_line_rem + chunk).split(b"\n")
+				self._proc_line_rem = lines[-1]
+				self._parse_stress_lines([ln.decode(errors='ignore').rstrip('\r') for ln in lines[:-1] if ln])
 			self.line_buffer += chunk
-		self._redraw_curve()
-		self._refresh_numeric_list()
-		self._update_export_enabled()
+		# Curves, readouts and export state are refreshed once per block in
+		# _maybe_emit_block
 		# Re-enable Execute if completion text is seen in AAOS status file stream
 		try:
 			if "Stress test completed" in getattr(self, '_raw_log_buffer', ''):
@@ -2468,7 +2701,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 				m = re.search(pat, line)
 				if m:
 					val = float(m.group(1))
-					self.core_states[core_id].values.append((ts, val))
+					self.core_states[core_id].values.append(ts, val)
 					break
 		
 		# Parse DRAM usage
@@ -2481,7 +2714,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 				m = re.search(pat, line)
 				if m:
 					val = float(m.group(1))
-					self.states[Subsystem.DRAM].values.append((ts, val))
+					self.states[Subsystem.DRAM].values.append(ts, val)
 					break
 		
 		# Parse GPU usage
@@ -2494,7 +2727,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 				m = re.search(pat, line)
 				if m:
 					val = float(m.group(1))
-					self.states[Subsystem.GPU].values.append((ts, val))
+					self.states[Subsystem.GPU].values.append(ts, val)
 					break
 		
 		# Fallback to old patterns for compatibility
@@ -2511,7 +2744,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 					m = re.search(pat, line)
 					if m:
 						val = float(m.group(1))
-						self.states[name].values.append((ts, val))
+						self.states[name].values.append(ts, val)
 						break
 		
 		# psutil fallback removed - using external backend for data collection
@@ -2531,10 +2764,10 @@ class PerformanceApp(QtWidgets.QMainWindow):
 					if state.curve is not None and not state.values:
 						state.curve.setData([], [])
 					continue
-				t0 = state.values[0][0]
-				x = [ts - t0 for ts, _ in state.values]
-				y = [max(0, min(100, v)) for _, v in state.values]  # Clamp values to 0-100%
-				state.curve.setData(x, y)
+				ts, vals = state.values.xy()
+				x = ts - ts[0]
+				y = np.clip(vals, 0, 100)  # Clamp values to 0-100%
+				state.curve.setData(x, y, skipFiniteCheck=True)  # Parsed samples are always finite
 			if any(self.core_states[c].values for c in range(getattr(self, 'core_count', 0))):
 				last_x = max((self.core_states[c].values[-1][0] - self.core_states[c].values[0][0]) for c in range(getattr(self, 'core_count', 0)) if self.core_states[c].values)
 				if last_x > 60:
@@ -2559,12 +2792,12 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		if not state.values:
 			state.curve.setData([], [])
 			return
-		t0 = state.values[0][0]
-		x = [ts - t0 for ts, _ in state.values]
-		y = [max(0, min(100, v)) for _, v in state.values]  # Clamp values to 0-100%
-		state.curve.setData(x, y)
-		if x:
-			span = x[-1]
+		ts, vals = state.values.xy()
+		x = ts - ts[0]
+		y = np.clip(vals, 0, 100)  # Clamp values to 0-100%
+		state.curve.setData(x, y, skipFiniteCheck=True)
+		if len(x):
+			span = float(x[-1])
 			# Dynamic trailing window that grows with total span but caps for readability
 			# 0-2min: show last 60s, 2-10min: last 3min, 10-60min: last 10min, >1h: last 20min
 			if span > 3600:
@@ -2581,7 +2814,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		self._on_view_range_changed()
 
 	def _refresh_numeric_list(self) -> None:
-		self.numeric_list.clear()
+		texts: List[str] = []
 		
 		# Add all subsystems (show all, not just active ones)
 		for name in SUBSYSTEMS:
@@ -2589,9 +2822,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			val: Optional[float] = state.values[-1][1] if state.values else None
 			# Show target only if this subsystem is active
 			target_text = f" (target {state.target_percent}%)" if name in self.active_subsystems else " (no target)"
-			text = f"{name}: {val:.1f}%{target_text}" if val is not None else f"{name}: --{target_text}"
-			item = QtWidgets.QListWidgetItem(text)
-			self.numeric_list.addItem(item)
+			texts.append(f"{name}: {val:.1f}%{target_text}" if val is not None else f"{name}: --{target_text}")
 		
 		# Add all CPU cores (show all, not just active ones)
 		for core_id in range(getattr(self, 'core_count', 0)):
@@ -2599,9 +2830,18 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			val: Optional[float] = state.values[-1][1] if state.values else None
 			# Show target only if this core is active
 			target_text = f" (target {state.target_percent}%)" if core_id in self.active_cores else " (no target)"
-			text = f"Core {core_id}: {val:.1f}%{target_text}" if val is not None else f"Core {core_id}: --{target_text}"
-			item = QtWidgets.QListWidgetItem(text)
-			self.numeric_list.addItem(item)
+			texts.append(f"Core {core_id}: {val:.1f}%{target_text}" if val is not None else f"Core {core_id}: --{target_text}")
+		
+		# The row set only changes with the core count; otherwise retext the
+		# existing items in place instead of rebuilding them every block
+		if self.numeric_list.count() == len(texts):
+			for i, text in enumerate(texts):
+				item = self.numeric_list.item(i)
+				if item.text() != text:
+					item.setText(text)
+		else:
+			self.numeric_list.clear()
+			self.numeric_list.addItems(texts)
 		
 		self._update_numeric_colors()
 		# Update KPI header labels with latest values
@@ -2682,7 +2922,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 				def _show_result():
 					try:
 						port = self.comm_console.uart_port_combo.currentText()
-						console_text = self.comm_console._port_logs.get(port, "")
+						console_text = self.comm_console.get_port_log(port)
 						
 						# Find the last cat command output
 						lines = console_text.split('\n')
@@ -2861,26 +3101,26 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		cpu_match = re.search(r'cpu:\s+([\d.]+)%', output)
 		if cpu_match and Subsystem.CPU in self.active_subsystems:
 			cpu_value = float(cpu_match.group(1))
-			self.states[Subsystem.CPU].values.append((ts, cpu_value))
+			self.states[Subsystem.CPU].values.append(ts, cpu_value)
 		
 		# Parse CPU core usage (from "cpu0: XX.XX%" lines)
 		for core_id in range(getattr(self, 'core_count', 0)):
 			core_match = re.search(rf'cpu{core_id}:\s+([\d.]+)%', output)
 			if core_match and core_id in self.active_cores:
 				core_value = float(core_match.group(1))
-				self.core_states[core_id].values.append((ts, core_value))
+				self.core_states[core_id].values.append(ts, core_value)
 		
 		# Parse DRAM usage (from "DRAM usage: XX.XXXXX%" line)
 		dram_match = re.search(r'DRAM usage:\s+([\d.]+)%', output)
 		if dram_match and Subsystem.DRAM in self.active_subsystems:
 			dram_value = float(dram_match.group(1))
-			self.states[Subsystem.DRAM].values.append((ts, dram_value))
+			self.states[Subsystem.DRAM].values.append(ts, dram_value)
 		
 		# Parse GPU usage (from "GPU usage: X%" line)
 		gpu_match = re.search(r'GPU usage:\s+([\d.]+)%', output)
 		if gpu_match and Subsystem.GPU in self.active_subsystems:
 			gpu_value = float(gpu_match.group(1))
-			self.states[Subsystem.GPU].values.append((ts, gpu_value))
+			self.states[Subsystem.GPU].values.append(ts, gpu_value)
 		
 		self._redraw_curve()
 		self._refresh_numeric_list()
@@ -2989,6 +3229,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			self.core_states[core_id].values.clear()
 		self._file_tail_pos = 0
 		self._file_tail_rem = b""
+		self._tail_generation += 1
 		self._redraw_curve()
 		self._refresh_numeric_list()
 		self._update_export_enabled()
@@ -2999,6 +3240,8 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		self.btn_export_png.setEnabled(self.combo_active.currentText() != "")
 
 	def _update_command_preview(self) -> None:
+		# A direct rebuild supersedes any pending debounced one
+		self._cmd_preview_timer.stop()
 		# Build stress command from current selections
 		os_sel = getattr(self, 'selected_target_os', None) or (self.combo_target_os.currentText() if hasattr(self, 'combo_target_os') else "")
 		is_aaos = (os_sel == "AAOS")
@@ -3052,35 +3295,63 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			# Start from the beginning so we read existing blocks first
 			self._file_tail_pos = 0
 			self._file_tail_rem = b""
+			self._tail_generation += 1
+			self._tail_watch_missed = False
 			self._file_block_idx = -1
+			self._dropped_blocks = 0
 			self._file_start_epoch = get_timestamp()
-			# Reset persistent block state
-			self._blk_active = False
-			self._blk_cpu_overall = None
-			self._blk_core_vals = {}
-			self._blk_dram_val = None
-			self._blk_gpu_val = None
-			# Immediately process current contents so first block shows at t=0
-			self._read_stress_file_tail()
-			# Continue listening for new blocks until completion line is seen
-			self._file_tail_timer.start()
-			# Add file watcher for immediate reaction on append/truncate
+			self._reset_block_parse()
+			# Drop any watch left from a previous tail
 			try:
 				self._file_watcher.removePaths(self._file_watcher.files())
 			except Exception:
 				pass
-			if os.path.exists(path):
-				self._file_watcher.addPath(path)
+			# Immediately process current contents so first block shows at t=0;
+			# this also puts the file under the watcher for append/truncate
+			self._read_stress_file_tail()
+			# Continue listening for new blocks until completion line is seen
+			self._file_tail_timer.start()
 		except Exception:
 			pass
 
+	def _reset_block_parse(self) -> None:
+		"""Reset the persistent block state shared by the file and process tails."""
+		self._blk_active = False
+		self._blk_cpu_overall = None
+		self._blk_core_vals = {}
+		self._blk_dram_val = None
+		self._blk_gpu_val = None
+
 	def _stop_tail_file(self) -> None:
 		self._file_tail_timer.stop()
 		self._file_tail_path = None
 		self._file_tail_rem = b""
+		self._tail_generation += 1
 		self._file_block_idx = -1
-
-	def _read_stress_file_tail(self) -> None:
+		self._dropped_blocks = 0
+		watched = self._file_watcher.files()
+		if watched:
+			self._file_watcher.removePaths(watched)
+
+	def _sync_tail_watch(self) -> None:
+		"""Keep the tail file under the watcher and pace the poll timer.
+
+		Appends are picked up by the watcher's fileChanged signal, so the timer
+		only runs as a slow safety net while the watch is held. If the file does
+		not exist yet or the watch was dropped (Qt removes it when the file is
+		replaced), fall back to the fast poll until it can be re-added. The fast
+		poll also stays on for the rest of the tail once the safety net has
+		caught an append the watcher missed (e.g. network or synced folders).
+		"""
+		path = self._file_tail_path
+		watched = path in self._file_watcher.files()
+		if not watched and os.path.exists(path):
+			watched = self._file_watcher.addPath(path)
+		interval = _TAIL_WATCHED_POLL_MS if watched and not self._tail_watch_missed else _TAIL_POLL_MS
+		if self._file_tail_timer.interval() != interval:
+			self._file_tail_timer.setInterval(interval)
+
+	def _read_stress_file_tail(self, polled: bool = False) -> None:
 		"""Read newly appended lines from the stress output file and parse blocks.
 
 		We look for blocks beginning with '[Monitor] CPU Usage (per core):' and ending
@@ -3089,23 +3360,35 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		"""
 		if not self._file_tail_path:
 			return
-		try:
-			# Handle truncation/rotation: if file shrank, restart at 0
-			try:
-				cur_size = os.path.getsize(self._file_tail_path)
-				if cur_size < self._file_tail_pos:
-					self._file_tail_pos = 0
-			except Exception:
-				pass
-			with open(self._file_tail_path, 'rb') as f:
-				f.seek(self._file_tail_pos)
-				data = f.read()
-				if not data:
-					return
-				self._file_tail_pos += len(data)
-				buf = self._file_tail_rem + data
-		except Exception:
+		self._sync_tail_watch()
+		# The read itself runs off the GUI thread so a slow filesystem cannot
+		# stall painting; parsing continues in _on_tail_read
+		if self._tail_reading:
+			self._tail_read_again = True
 			return
+		self._tail_reading = True
+		self._tail_read_again = False
+		self._tail_read_polled = polled and self._file_tail_timer.interval() == _TAIL_WATCHED_POLL_MS
+		QtCore.QThreadPool.globalInstance().start(_TailReadWorker(
+			self._tail_read_signals, self._tail_generation, self._file_tail_path, self._file_tail_pos))
+
+	def _on_tail_read(self, result: Tuple[int, int, int, Optional[bytes]]) -> None:
+		"""Parse bytes read by _TailReadWorker, then run any read requested meanwhile."""
+		generation, pos, file_size, data = result
+		self._tail_reading = False
+		if generation == self._tail_generation and self._file_tail_path and data:
+			if self._tail_read_polled and not self._tail_read_again and not self._tail_watch_missed:
+				# The safety net found an append the watcher never reported
+				self._tail_watch_missed = True
+				self._sync_tail_watch()
+			self._file_tail_pos = pos
+			self._consume_tail_bytes(data, file_size)
+		if self._tail_read_again:
+			self._read_stress_file_tail()
+
+	def _consume_tail_bytes(self, data: bytes, file_size: int) -> None:
+		"""Split appended file bytes into lines, parse blocks and feed the log views."""
+		buf = self._file_tail_rem + data
 		# Split into lines keeping remainder
 		lines = buf.split(b"\n")
 		self._file_tail_rem = lines[-1]
@@ -3127,8 +3410,8 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		# Update debug tail status
 		if hasattr(self, 'tail_status'):
 			try:
-				file_size = os.path.getsize(self._file_tail_path) if self._file_tail_path and os.path.exists(self._file_tail_path) else 0
-				self.tail_status.setText(f"size={file_size} pos={self._file_tail_pos} lines={len(new_lines)} q={len(self._block_queue)} idx={self._file_block_idx}")
+				shown_size = file_size if self._file_tail_path else 0
+				self.tail_status.setText(f"size={shown_size} pos={self._file_tail_pos} lines={len(new_lines)} q={len(self._block_queue)} idx={self._file_block_idx} drop={self._dropped_blocks}")
 			except Exception:
 				pass
 		# Also append to raw buffer for Show Log
@@ -3155,14 +3438,14 @@ class PerformanceApp(QtWidgets.QMainWindow):
 			if not self._blk_active:
 				continue
 			# Parse CPU overall and per-core lines
-			m = re.search(r"^\s*cpu:\s*([0-9]+(?:\.[0-9]+)?)%", line)
+			m = _BLOCK_CPU_RE.match(line)
 			if m:
 				try:
 					self._blk_cpu_overall = float(m.group(1))
 				except Exception:
 					pass
 				continue
-			m2 = re.search(r"^\s*cpu(\d+):\s*([0-9]+(?:\.[0-9]+)?)%", line)
+			m2 = _BLOCK_CORE_RE.match(line)
 			if m2:
 				try:
 					cid = int(m2.group(1))
@@ -3171,14 +3454,14 @@ class PerformanceApp(QtWidgets.QMainWindow):
 					pass
 				continue
 			# DRAM and GPU (exact match to sample)
-			m3 = re.search(r"^\[Monitor\]\s*DRAM\s*usage:\s*([0-9]+(?:\.[0-9]+)?)%", line)
+			m3 = _BLOCK_DRAM_RE.match(line)
 			if m3:
 				try:
 					self._blk_dram_val = float(m3.group(1))
 				except Exception:
 					pass
 				continue
-			m4 = re.search(r"^\[Monitor\]\s*GPU\s*usage:\s*([0-9]+(?:\.[0-9]+)?)%", line)
+			m4 = _BLOCK_GPU_RE.match(line)
 			if m4:
 				try:
 					self._blk_gpu_val = float(m4.group(1))
@@ -3221,33 +3504,40 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		# If this is the first block queued, schedule immediate emit and 5s cadence
 		if not self._block_timer.isActive():
 			self._file_block_idx = -1
-			self._next_block_due_epoch = get_timestamp()
+			self._dropped_blocks = 0
+			self._next_block_due_epoch = get_monotonic_time()
 			self._block_timer.start()
+		elif len(self._block_queue) > _MAX_BACKLOG_BLOCKS:
+			# Playback fell behind (e.g. window hidden or a long file replayed):
+			# skip stale blocks, keeping their time slots so later ones stay on time
+			drop = len(self._block_queue) - _BACKLOG_TRIM_BLOCKS
+			del self._block_queue[:drop]
+			self._file_block_idx += drop
+			self._dropped_blocks += drop
 
 	def _maybe_emit_block(self) -> None:
 		if not self._block_queue or self._next_block_due_epoch is None:
 			return
-		if get_timestamp() < self._next_block_due_epoch:
+		if get_monotonic_time() < self._next_block_due_epoch:
 			return
 		cpu_overall, core_vals, dram_val, gpu_val = self._block_queue.pop(0)
 		self._file_block_idx += 1
-		start_epoch = getattr(self, '_file_start_epoch', get_timestamp())
-		block_ts = start_epoch + 5.0 * max(0, self._file_block_idx)
+		block_ts = self._file_start_epoch + 5.0 * max(0, self._file_block_idx)
 		if cpu_overall is not None:
-			self.states[Subsystem.CPU].values.append((block_ts, max(0, min(100, cpu_overall))))
+			self.states[Subsystem.CPU].values.append(block_ts, max(0, min(100, cpu_overall)))
 		for cid, v in core_vals.items():
 			if cid in self.core_states:
-				self.core_states[cid].values.append((block_ts, max(0, min(100, v))))
+				self.core_states[cid].values.append(block_ts, max(0, min(100, v)))
 		if dram_val is not None:
-			self.states[Subsystem.DRAM].values.append((block_ts, max(0, min(100, dram_val))))
+			self.states[Subsystem.DRAM].values.append(block_ts, max(0, min(100, dram_val)))
 		if gpu_val is not None:
-			self.states[Subsystem.GPU].values.append((block_ts, max(0, min(100, gpu_val))))
+			self.states[Subsystem.GPU].values.append(block_ts, max(0, min(100, gpu_val)))
 		# Update UI
 		self._redraw_curve()
 		self._refresh_numeric_list()
 		self._update_export_enabled()
 		# Schedule next block 5s later (if any)
-		self._next_block_due_epoch = get_timestamp() + 5.0
+		self._next_block_due_epoch = get_monotonic_time() + 5.0
 		if not self._block_queue:
 			# Keep timer running to catch future blocks; do not stop
 			pass
@@ -3273,7 +3563,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		if not self.scheduled_changes:
 			return
 		
-		self.test_start_time = get_timestamp()
+		self.test_start_time = get_monotonic_time()
 		self.schedule_timer = QtCore.QTimer(self)
 		self.schedule_timer.setInterval(1000)  # Check every second
 		self.schedule_timer.timeout.connect(self._check_scheduled_changes)
@@ -3291,7 +3581,7 @@ class PerformanceApp(QtWidgets.QMainWindow):
 		if not self.is_running or not self.test_start_time:
 			return
 		
-		elapsed_time = get_timestamp() - self.test_start_time
+		elapsed_time = get_monotonic_time() - self.test_start_time
 
 		# Handle harmonic ramps in progress
 		if self.active_harmonics: